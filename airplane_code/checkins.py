@@ -137,6 +137,10 @@ class RealisticFastCheckInsGenerator:
         
         # Create customer lookup for names
         self.customer_names = dict(zip(self.clients_df['client_id'], self.clients_df['name']))
+        # Surnames split once up front for infant names
+        self.customer_surnames = dict(zip(
+            self.clients_df['client_id'], np.char.rpartition(self.clients_df['name'].to_numpy(dtype=str), ' ')[:, 2]
+        ))
         
         print(f"Loaded data for {self.TARGET_YEAR}:")
         print(f"- {len(self.valid_bookings):,} total valid bookings")
@@ -250,7 +254,7 @@ class RealisticFastCheckInsGenerator:
             return main_name
         
         if is_infant:
-            surname = main_name.split()[-1] if ' ' in main_name else main_name
+            surname = self.customer_surnames.get(customer_id, main_name)
             return f"Infant {surname}"
         
         # Generate realistic name variation
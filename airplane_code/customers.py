@@ -2,23 +2,46 @@ import pandas as pd
 import numpy as np
 from faker import Faker
 from datetime import datetime, date, timedelta
-from tqdm import tqdm
-import random
 import os
 import re
 
 # Set random seeds for reproducibility
 seed_bytes = os.urandom(4)
 seed_int = int.from_bytes(seed_bytes, byteorder='big')
-random.seed(seed_int)
-np.random.seed(seed_int)
+rng = np.random.default_rng(seed_int)
 
 
 # Constants
 TARGET_YEAR = 2020
-NUM_INDIVIDUALS = random.randint(random.randint(70000, 200000), random.randint(200000, 500000))
+# Client count between 70,000 and 500,000, most likely around 200,000
+NUM_INDIVIDUALS = int(rng.triangular(70000, 200000, 500000))
 ENTRY_MODES = ['Website', 'Mobile Application', 'Agent', 'Walk-in']
 
+# Upper bound on how many values are pre-generated per Faker provider and locale
+FAKER_POOL_SIZE = 5000
+PARQUET_ROW_GROUP_SIZE = 8192
+
+# Categorical fields and their weights, drawn a column at a time
+GROUP_SIZES = [1, 2, 3, 4, 5]
+GROUP_SIZE_WEIGHTS = [0.5, 0.3, 0.15, 0.03, 0.02]
+GENDERS = ['M', 'F', 'Other', 'Prefer not to say']
+GENDER_WEIGHTS = [0.48, 0.48, 0.02, 0.02]
+SA_ID_TYPES = ['National ID', 'Passport', "Driver's License"]
+SA_ID_TYPE_WEIGHTS = [0.6, 0.3, 0.1]
+FOREIGN_ID_TYPES = ['Passport', "Driver's License"]
+FOREIGN_ID_TYPE_WEIGHTS = [0.7, 0.3]
+EMAIL_DOMAINS = ['gmail.com', 'outlook.com', 'yahoo.com', 'hotmail.com']
+EMAIL_STRIP_RE = re.compile(r'[^a-zA-Z0-9]')
+MARKETING_CONSENT_WEIGHTS = [0.7, 0.3]
+COMM_PREFS = ['Email', 'SMS', 'Phone', 'Mail']
+COMM_PREF_WEIGHTS = [0.4, 0.3, 0.2, 0.1]
+
+# Low-cardinality client columns stored as categoricals
+CATEGORY_COLUMNS = [
+    'gender', 'nationality', 'id_type', 'city', 'province_state',
+    'marketing_consent', 'comm_pref', 'entry_mode'
+]
+
 # Phone plans dictionary with Faker locales
 PHONE_PLANS = {
     'South Africa': {'cc': '+27', 'nsn_length': 9, 'mobile_prefixes': ['60','61','62','63','64','65','66','67','68','71','72','73','74','76','78','79','81','82','83','84'], 'faker_locale': 'zu_ZA'},
@@ -43,6 +66,7 @@ PHONE_PLANS = {
 
 # Initialize Faker instances for each country
 FAKER_INSTANCES = {country: Faker(locale) for country, details in PHONE_PLANS.items() for locale in [details['faker_locale']]}
+FOREIGN_COUNTRIES = [c for c in PHONE_PLANS.keys() if c != 'South Africa']
 
 # City and province lists for Zimbabwe, Kenya, and Nigeria
 COUNTRY_CITIES_PROVINCES = {
@@ -69,144 +93,241 @@ COUNTRY_CITIES_PROVINCES = {
     ]
 }
 
-def generate_id_number(nationality, id_type, dob, gender, faker):
-    """Generate ID number based on nationality and ID type."""
-    if id_type == 'National ID':
-        if nationality == 'South Africa':
-            dob_str = dob.strftime('%y%m%d')
-            seq = f'{random.randint(0, 9999):04d}'
-            gender_digit = '0' if gender == 'F' else '1'
-            citizenship = random.choice(['0', '1'])
-            check_digit = random.randint(0, 9)
-            return f'{dob_str}{seq}{gender_digit}{citizenship}{check_digit}'
-        else:
-            raise ValueError("National ID is only allowed for South Africans")
-    elif id_type == 'Passport':
-        if nationality == 'South Africa':
-            return f'{random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")}{random.randint(10000000, 99999999)}'
-        elif nationality in ['United States', 'Canada']:
-            return f'{random.randint(100000000, 999999999)}'
-        else:
-            return f'{random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")}{random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")}{random.randint(1000000, 9999999)}'
-    else:  # Driver's License
-        if nationality == 'South Africa':
-            initials = ''.join([name[0] for name in faker.name().split()[:2]]).upper()
-            dob_str = dob.strftime('%y%m%d')
-            seq = f'{random.randint(0, 9999):04d}'
-            return f'{initials}{dob_str}{seq}'
-        elif nationality in ['United States', 'Canada']:
-            return f'D{random.randint(10000000, 99999999)}'
-        else:
-            return f'{random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")}{random.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")}{random.randint(10000000, 99999999)}'
-
-def generate_phone_number(nationality):
-    """Generate a valid mobile phone number based on nationality."""
-    plan = PHONE_PLANS.get(nationality, PHONE_PLANS['United States'])
-    cc = plan['cc']
-    nsn_length = plan['nsn_length']
-    prefix = random.choice(plan['mobile_prefixes'])
-    remaining_length = nsn_length - len(prefix)
-    digits = ''.join([str(random.randint(0, 9)) for _ in range(remaining_length)])
-    return f'{cc}{prefix}{digits}'
-
-def get_city_province(nationality, faker_instance):
-    """Get city and province for specific countries, fallback to Faker for others."""
-    if nationality in COUNTRY_CITIES_PROVINCES:
-        city_province = random.choice(COUNTRY_CITIES_PROVINCES[nationality])
-        return city_province['city'], city_province['province']
-    else:
-        city = faker_instance.city()
+LETTERS = np.array(list('ABCDEFGHIJKLMNOPQRSTUVWXYZ'))
+
+def random_number_strings(low, high, size):
+    """Random integers in [low, high] as decimal strings."""
+    return rng.integers(low, high + 1, size=size).astype(str)
+
+def generate_id_numbers(nationalities, id_types, dobs, genders, names):
+    """Generate ID numbers for every person based on nationality and ID type."""
+    n = len(nationalities)
+    is_sa = nationalities == 'South Africa'
+    is_north_american = np.isin(nationalities, ['United States', 'Canada'])
+    is_passport = id_types == 'Passport'
+    is_license = id_types == "Driver's License"
+
+    # YYMMDD from the date of birth and a 4-digit sequence number
+    dob_days = np.array(dobs, dtype='datetime64[D]')
+    dob_months = dob_days.astype('datetime64[M]')
+    yymmdd = (
+        (dob_days.astype('datetime64[Y]').astype(np.int64) + 1970) % 100 * 10000
+        + (dob_months.astype(np.int64) % 12 + 1) * 100
+        + (dob_days - dob_months).astype(np.int64) + 1
+    )
+    dob_str = np.char.zfill(yymmdd.astype(str), 6)
+    seq = np.char.zfill(random_number_strings(0, 9999, n), 4)
+    letters = LETTERS[rng.integers(0, len(LETTERS), size=(n, 2))]
+    two_letters = np.char.add(letters[:, 0], letters[:, 1])
+
+    # National ID is only issued to South Africans (see SA_ID_TYPES)
+    national_ids = np.char.add(np.char.add(dob_str, seq), np.where(genders == 'F', '0', '1'))
+    national_ids = np.char.add(np.char.add(national_ids, random_number_strings(0, 1, n)), random_number_strings(0, 9, n))
+
+    # Driver's license initials come from the holder's first two names
+    initials = np.full(n, '', dtype=object)
+    sa_license = np.flatnonzero(is_license & is_sa)
+    initials[sa_license] = [''.join(part[0] for part in names[i].split()[:2]).upper() for i in sa_license]
+
+    id_numbers = np.select(
+        [
+            id_types == 'National ID',
+            is_passport & is_sa,
+            is_passport & is_north_american,
+            is_passport,
+            is_license & is_sa,
+            is_license & is_north_american,
+        ],
+        [
+            national_ids,
+            np.char.add(letters[:, 0], random_number_strings(10000000, 99999999, n)),
+            random_number_strings(100000000, 999999999, n),
+            np.char.add(two_letters, random_number_strings(1000000, 9999999, n)),
+            np.char.add(np.char.add(initials.astype(str), dob_str), seq),
+            np.char.add('D', random_number_strings(10000000, 99999999, n)),
+        ],
+        default=np.char.add(two_letters, random_number_strings(10000000, 99999999, n))
+    )
+    return id_numbers.astype(object)
+
+def generate_phone_numbers(nationalities):
+    """Generate a valid mobile phone number for each person based on nationality."""
+    phone_numbers = np.empty(len(nationalities), dtype=object)
+    for nationality in np.unique(nationalities):
+        rows = np.flatnonzero(nationalities == nationality)
+        plan = PHONE_PLANS.get(nationality, PHONE_PLANS['United States'])
+        prefixes = np.array(plan['mobile_prefixes'])[rng.integers(0, len(plan['mobile_prefixes']), size=len(rows))]
+        prefix_lengths = np.char.str_len(prefixes)
+        for prefix_length in np.unique(prefix_lengths):
+            group = prefix_lengths == prefix_length
+            remaining_length = plan['nsn_length'] - prefix_length
+            digits = rng.integers(0, 10, size=(group.sum(), remaining_length), dtype=np.uint8) + np.uint8(ord('0'))
+            phone_numbers[rows[group]] = np.char.add(
+                np.char.add(plan['cc'], prefixes[group]), digits.view(f'S{remaining_length}').ravel().astype(str)
+            )
+    return phone_numbers
+
+def faker_province(faker_instance):
+    """A province-level region from Faker, whichever provider the locale has."""
+    for provider in ('administrative_unit', 'province', 'state'):
         try:
-            province = faker_instance.administrative_unit()
+            return getattr(faker_instance, provider)()
         except AttributeError:
-            try:
-                province = faker_instance.province()
-            except AttributeError:
-                try:
-                    province = faker_instance.state()
-                except AttributeError:
-                    province = "Unknown"
-        return city, province
-
-class Person:
-    def __init__(self, client_id, is_main_holder=False):
-        """Generate customer information."""
-        # Ensure 60% South Africans
-        self.nationality = random.choices(
-            ['South Africa'] + [c for c in PHONE_PLANS.keys() if c != 'South Africa'],
-            weights=[(random.randint(60, 100) / 100) * 1.00] + [((random.randint(20, 40) / 100) * 1.00) / (len(PHONE_PLANS) - 1)] * (len(PHONE_PLANS) - 1)
-        )[0]
-        self.faker = FAKER_INSTANCES[self.nationality]
-        self.client_id = client_id
-        self.is_main_holder = is_main_holder
-
-        # Basic info
-        self.name = self.faker.name()
-        min_age = 18 if is_main_holder else 0
-        self.dob = self.faker.date_of_birth(minimum_age=min_age, maximum_age=80)
-        self.gender = random.choices(['M', 'F', 'Other', 'Prefer not to say'], weights=[0.48, 0.48, 0.02, 0.02])[0]
-
-        # ID details
-        if self.nationality == 'South Africa':
-            self.id_type = random.choices(['National ID', 'Passport', "Driver's License"], weights=[0.6, 0.3, 0.1])[0]
+            continue
+    return "Unknown"
+
+def sample_cities_provinces(nationalities):
+    """City and province for each person: from the fixed lists for Zimbabwe,
+    Kenya and Nigeria, otherwise from per-nationality pools of Faker values."""
+    cities = np.empty(len(nationalities), dtype=object)
+    provinces = np.empty(len(nationalities), dtype=object)
+    for nationality in np.unique(nationalities):
+        rows = np.flatnonzero(nationalities == nationality)
+        if nationality in COUNTRY_CITIES_PROVINCES:
+            choices = COUNTRY_CITIES_PROVINCES[nationality]
+            city_pool = np.array([choice['city'] for choice in choices], dtype=object)
+            province_pool = np.array([choice['province'] for choice in choices], dtype=object)
         else:
-            self.id_type = random.choices(['Passport', "Driver's License"], weights=[0.7, 0.3])[0]
-        self.id_number = generate_id_number(self.nationality, self.id_type, self.dob, self.gender, self.faker)
-        self.travel_document_expiry = self.faker.date_between(start_date=date(TARGET_YEAR, 1, 1), end_date=date(TARGET_YEAR + 10, 12, 31)) if self.id_type == 'Passport' else None
-
-        # Contact details
-        email_domain = random.choice(['gmail.com', 'outlook.com', 'yahoo.com', 'hotmail.com'])
-        email_name = re.sub(r'[^a-zA-Z0-9]', '', self.name.lower().replace(' ', '.'))
-        self.email_address = f'{email_name}@{email_domain}'
-        self.phone_number = generate_phone_number(self.nationality)
-        self.address = self.faker.street_address()
-        
-        # Get city and province
-        self.city, self.province_state = get_city_province(self.nationality, self.faker)
-
-        self.marketing_consent = random.choices(['Yes', 'No'], weights=[0.7, 0.3])[0]
-        self.comm_pref = random.choices(['Email', 'SMS', 'Phone', 'Mail'], weights=[0.4, 0.3, 0.2, 0.1])[0]
-
-        # Registration details
-        self.date_of_registration = self.faker.date_between(start_date=date(TARGET_YEAR, 1, 1), end_date=date(TARGET_YEAR, 12, 31))
-        self.entry_mode = random.choice(ENTRY_MODES)
+            faker = FAKER_INSTANCES[nationality]
+            pool_size = min(len(rows), FAKER_POOL_SIZE)
+            city_pool = np.array([faker.city() for _ in range(pool_size)], dtype=object)
+            province_pool = np.array([faker_province(faker) for _ in range(pool_size)], dtype=object)
+        picks = rng.integers(0, len(city_pool), size=len(rows))
+        cities[rows] = city_pool[picks]
+        provinces[rows] = province_pool[picks]
+    return cities, provinces
+
+def sample_faker_values(nationalities, provider):
+    """Sample a Faker provider's values for each person from a per-nationality pool."""
+    values = np.empty(len(nationalities), dtype=object)
+    for nationality in np.unique(nationalities):
+        rows = np.flatnonzero(nationalities == nationality)
+        faker = FAKER_INSTANCES[nationality]
+        pool = np.array([getattr(faker, provider)() for _ in range(min(len(rows), FAKER_POOL_SIZE))], dtype=object)
+        values[rows] = pool[rng.integers(0, len(pool), size=len(rows))]
+    return values
+
+def random_dates(start_date, end_date, size):
+    """Uniform dates between start_date and end_date (inclusive) as date objects."""
+    offsets = rng.integers(0, (end_date - start_date).days + 1, size=size)
+    return (np.datetime64(start_date) + offsets).astype(object)
+
+def years_before(day, years):
+    """The same calendar day the given number of years earlier (28 Feb for 29 Feb)."""
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+def random_birth_dates(is_main_holder):
+    """Dates of birth for ages 0-80, at least 18 for main holders, matching Faker's date_of_birth range."""
+    today = date.today()
+    earliest = years_before(today, 81) + timedelta(days=1)
+    n = len(is_main_holder)
+    return np.where(
+        is_main_holder,
+        random_dates(earliest, years_before(today, 18), n),
+        random_dates(earliest, today, n)
+    )
+
+def generate_people(client_ids, is_main_holder):
+    """Generate customer information for a batch of people, one array per column."""
+    n = len(client_ids)
+
+    # Ensure 60% South Africans: each person draws their own SA weight
+    # (0.60-1.00) and combined foreign weight (0.20-0.40) as before
+    sa_weights = rng.integers(60, 101, size=n) / 100
+    foreign_weights = rng.integers(20, 41, size=n) / 100
+    is_sa = rng.random(n) * (sa_weights + foreign_weights) < sa_weights
+    nationalities = np.where(is_sa, 'South Africa', rng.choice(FOREIGN_COUNTRIES, size=n))
+
+    # Basic info
+    names = sample_faker_values(nationalities, 'name')
+    dobs = random_birth_dates(is_main_holder)
+    genders = rng.choice(GENDERS, size=n, p=GENDER_WEIGHTS)
+
+    # ID details
+    id_types = np.where(
+        is_sa,
+        rng.choice(SA_ID_TYPES, size=n, p=SA_ID_TYPE_WEIGHTS),
+        rng.choice(FOREIGN_ID_TYPES, size=n, p=FOREIGN_ID_TYPE_WEIGHTS)
+    )
+    id_numbers = generate_id_numbers(nationalities, id_types, dobs, genders, names)
+    travel_document_expiry = np.where(
+        id_types == 'Passport', random_dates(date(TARGET_YEAR, 1, 1), date(TARGET_YEAR + 10, 12, 31), n), None
+    )
+
+    # Contact details
+    email_domains = rng.choice(EMAIL_DOMAINS, size=n)
+    # Names come from pools, so each distinct name is cleaned once; a per-row
+    # number keeps people who share a pooled name from sharing an address,
+    # and the few addresses that still collide get a fresh number and domain
+    unique_names, name_idx = np.unique(names.astype(str), return_inverse=True)
+    email_users = np.array([EMAIL_STRIP_RE.sub('', name.lower()) for name in unique_names], dtype=object)[name_idx]
+    email_numbers = rng.integers(1, 10000, size=n).astype(str).astype(object)
+    email_addresses = email_users + email_numbers + '@' + email_domains.astype(object)
+    duplicated = pd.Series(email_addresses).duplicated().to_numpy()
+    while duplicated.any():
+        email_numbers = rng.integers(1, 10000, size=duplicated.sum()).astype(str).astype(object)
+        email_domains = rng.choice(EMAIL_DOMAINS, size=duplicated.sum()).astype(object)
+        email_addresses[duplicated] = email_users[duplicated] + email_numbers + '@' + email_domains
+        duplicated = pd.Series(email_addresses).duplicated().to_numpy()
+    phone_numbers = generate_phone_numbers(nationalities)
+    addresses = sample_faker_values(nationalities, 'street_address')
+
+    # Get city and province
+    cities, provinces = sample_cities_provinces(nationalities)
+
+    # Registration details
+    dates_of_registration = random_dates(date(TARGET_YEAR, 1, 1), date(TARGET_YEAR, 12, 31), n)
+
+    return pd.DataFrame({
+        'client_id': client_ids,
+        'is_main_holder': is_main_holder,
+        'name': names,
+        'dob': dobs,
+        'gender': genders,
+        'nationality': nationalities,
+        'id_type': id_types,
+        'id_number': id_numbers,
+        'travel_document_expiry': travel_document_expiry,
+        'email_address': email_addresses,
+        'phone_number': phone_numbers,
+        'address': addresses,
+        'city': cities,
+        'province_state': provinces,
+        'marketing_consent': rng.choice(['Yes', 'No'], size=n, p=MARKETING_CONSENT_WEIGHTS),
+        'comm_pref': rng.choice(COMM_PREFS, size=n, p=COMM_PREF_WEIGHTS),
+        'date_of_registration': dates_of_registration,
+        'entry_mode': rng.choice(ENTRY_MODES, size=n)
+    }).astype(dict.fromkeys(CATEGORY_COLUMNS, 'category'))
 
 def generate_clients():
     """Generate client data with shared client IDs."""
-    data = []
-    client_counter = 1  # Counter for sequential numbering
-    individuals_left = NUM_INDIVIDUALS
-
-    for _ in tqdm(range(NUM_INDIVIDUALS), desc="Generating clients"):
-        group_size = random.choices([1, 2, 3, 4, 5], weights=[0.5, 0.3, 0.15, 0.03, 0.02])[0]
-        group_size = min(group_size, individuals_left)
-        if group_size == 0:
-            break
-
-        # Generate client ID in format CL{TARGET_YEAR}0001
-        client_id = f"CL{TARGET_YEAR}{client_counter:04d}"
-        
-        # Main holder (must be over 18)
-        data.append(Person(client_id, is_main_holder=True).__dict__)
-        # Additional members (can be any age)
-        for _ in range(group_size - 1):
-            data.append(Person(client_id, is_main_holder=False).__dict__)
-        
-        client_counter += 1
-        individuals_left -= group_size
-
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
-    # Drop faker object and reorder columns
-    df = df[['client_id', 'is_main_holder', 'name', 'dob', 'gender', 'nationality', 'id_type', 'id_number',
-             'travel_document_expiry', 'email_address', 'phone_number', 'address', 'city', 'province_state',
-             'marketing_consent', 'comm_pref', 'date_of_registration', 'entry_mode']]
-    return df
+    # Draw enough group sizes to cover NUM_INDIVIDUALS, then trim the last
+    # group so the total matches exactly
+    group_sizes = rng.choice(GROUP_SIZES, size=NUM_INDIVIDUALS, p=GROUP_SIZE_WEIGHTS)
+    num_groups = int(np.searchsorted(np.cumsum(group_sizes), NUM_INDIVIDUALS)) + 1
+    group_sizes = group_sizes[:num_groups]
+    group_sizes[-1] -= group_sizes.sum() - NUM_INDIVIDUALS
+
+    # Client IDs in format CL{TARGET_YEAR}0001, shared by everyone in a group;
+    # the first member of each group is the main holder (must be over 18)
+    group_ids = np.array([f"CL{TARGET_YEAR}{client_counter:04d}" for client_counter in range(1, num_groups + 1)], dtype=object)
+    client_ids = np.repeat(group_ids, group_sizes)
+    group_starts = np.cumsum(group_sizes) - group_sizes
+    is_main_holder = np.zeros(NUM_INDIVIDUALS, dtype=bool)
+    is_main_holder[group_starts] = True
+
+    return generate_people(client_ids, is_main_holder)
 
 # Generate and save data
 os.makedirs('airplane_data', exist_ok=True)
 clients_df = generate_clients()
-clients_df.to_parquet(f'airplane_data/clients_{TARGET_YEAR}.parquet', index=False)
+clients_df.to_parquet(
+    f'airplane_data/clients_{TARGET_YEAR}.parquet', engine='pyarrow', compression='zstd',
+    compression_level=3, use_dictionary=True, row_group_size=PARQUET_ROW_GROUP_SIZE, index=False
+)
 print(f"Saved {len(clients_df)} records to airplane_data/clients_{TARGET_YEAR}.parquet")
 
 # Verify South African percentage and National ID restriction
@@ -1,34 +1,118 @@
 import pandas as pd
 import numpy as np
 import random
-from faker import Faker
-from datetime import date, timedelta
+from datetime import date
 import os
 from tqdm import tqdm
 import argparse
+import pyarrow as pa
+import pyarrow.parquet as pq
+from bisect import bisect
+from itertools import accumulate
+
+# Filtered customer frames are only read, so let them share memory with the
+# source frame (Copy-on-Write is always on from pandas 3.0)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
+# Accounts are flushed to parquet in batches of this many rows
+ACCOUNT_BATCH_SIZE = 50000
+
+# Weighted draws made once per account are stored as (options, cumulative
+# weights) so weighted_choice only has to bisect. It consumes one
+# rnd.random() per draw and picks the same option rnd.choices would give
+def cumulative_choices(options, weights):
+    return tuple(options), tuple(accumulate(weights))
+
+def weighted_choice(rnd, choices):
+    options, cum_weights = choices
+    return options[bisect(cum_weights, rnd.random() * cum_weights[-1], 0, len(cum_weights) - 1)]
+
+# Account opening channels and their normalized selection weights
+OPENING_CHANNELS = ['branch', 'online', 'mobile_app', 'phone', 'agent']
+OPENING_CHANNEL_WEIGHTS = np.array([0.85, 0.25, 0.15, 0.10, 0.05])
+OPENING_CHANNEL_WEIGHTS /= OPENING_CHANNEL_WEIGHTS.sum()
+OPENING_CHANNEL_CHOICES = cumulative_choices(OPENING_CHANNELS, OPENING_CHANNEL_WEIGHTS.tolist())
+
+# Individual account types by annual income band
+ACCOUNT_TYPES_UNDER_100K = cumulative_choices(['easy', 'savings'], [0.7, 0.3])
+ACCOUNT_TYPES_UNDER_300K = cumulative_choices(['savings', 'current', 'cheque'], [0.5, 0.3, 0.2])
+ACCOUNT_TYPES_UNDER_600K = cumulative_choices(['current', 'cheque', 'aspire', 'gold'], [0.3, 0.2, 0.3, 0.2])
+ACCOUNT_TYPES_UNDER_1M = cumulative_choices(['gold', 'premium', 'current'], [0.4, 0.4, 0.2])
+ACCOUNT_TYPES_1M_PLUS = cumulative_choices(['platinum', 'premium', 'gold'], [0.5, 0.3, 0.2])
+
+# Account statuses for new unverified, high risk, elevated risk and all other accounts
+PENDING_STATUSES = cumulative_choices(['pending_verification', 'active'], [0.3, 0.7])
+HIGH_RISK_STATUSES = cumulative_choices(['active', 'restricted', 'frozen'], [0.6, 0.25, 0.15])
+ELEVATED_RISK_STATUSES = cumulative_choices(['active', 'restricted'], [0.85, 0.15])
+STANDARD_STATUSES = cumulative_choices(['active', 'dormant'], [0.92, 0.08])
+
+# Membership tests made once per account, kept as sets for O(1) lookups
+BRANCH_VISIT_CHANNELS = frozenset({'branch', 'agent'})
+DIGITAL_CHANNELS = frozenset({'online', 'mobile_app'})
+STAFF_ASSISTED_CHANNELS = frozenset({'branch', 'phone', 'agent'})
+PREMIUM_ACCOUNT_TYPES = frozenset({'premium', 'gold', 'platinum'})
+CREDIT_ACCOUNT_TYPES = frozenset({'credit_card', 'overdraft_facility', 'business_credit_line'})
+NO_EMPLOYER_OCCUPATIONS = frozenset({'Unemployed', 'Student', 'Self-Employed'})
+
+# Fixed output schema so every streamed batch matches, even when a batch
+# happens to contain only nulls for an optional column
+ACCOUNT_SCHEMA = pa.schema([
+    ('account_id', pa.string()),
+    ('customer_id', pa.string()),
+    ('account_type', pa.string()),
+    ('opening_date', pa.date32()),
+    ('branch_code', pa.string()),
+    ('kyc_verified', pa.bool_()),
+    ('fica_verified', pa.bool_()),
+    ('expected_amount', pa.float64()),
+    ('account_status', pa.string()),
+    ('linked_joint_accounts', pa.string()),
+    ('interest_rate', pa.float64()),
+    ('monthly_charges', pa.int16()),
+    ('transactions_rate', pa.float64()),
+    ('negative_balance_rate', pa.float64()),
+    ('bundled_products', pa.string()),
+    ('currency', pa.string()),
+    ('account_tier', pa.string()),
+    ('account_balance', pa.float64()),
+    ('transaction_volume', pa.int16()),
+    ('credit_limit', pa.float64()),
+    ('proof_of_income_provided', pa.bool_()),
+    ('proof_of_address_provided', pa.bool_()),
+    ('bank_statements_provided', pa.bool_()),
+    ('employer_letter_provided', pa.bool_()),
+    ('business_registration_provided', pa.bool_()),
+    ('tax_certificate_provided', pa.bool_()),
+    ('minimum_deposit_met', pa.bool_()),
+    ('opening_channel', pa.string()),
+    ('requires_branch_visit', pa.bool_()),
+    ('digital_onboarding', pa.bool_()),
+    ('staff_assisted', pa.bool_()),
+    ('verification_method', pa.string()),
+    ('instant_approval', pa.bool_()),
+])
 
 # Helper functions defined at module level
 def calculate_age(birth_date, target_year):
     # Calculate age based on the target year instead of current date
     return target_year - birth_date.year
 
-def get_income_level(customer_data):
-    income = customer_data.get('annual_income', 300000)
-    if income < 100000:
-        return 'low'
-    elif income < 600000:
-        return 'medium'
-    else:
-        return 'high'
+def get_income_levels(df_group):
+    # Income band per customer for the whole group; missing incomes fall
+    # through to 'high' like the comparisons they replace
+    income = df_group['annual_income'].to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.select([income < 100000, income < 600000], ['low', 'medium'], default='high')
 
 def generate_accounts(year):
+    """Write the year's accounts to parquet; returns the file path, or None if the customer file is missing"""
     # Initialize seeds for reproducibility
     seed_bytes = os.urandom(4)
     seed_int = int.from_bytes(seed_bytes, byteorder='big')
-    random.seed(seed_int)
+    # Python-level draws come from this instance rather than the shared
+    # module-level generator
+    rnd = random.Random(seed_int)
     np.random.seed(seed_int)
-    Faker.seed(seed_int)
-    fake = Faker('zu_ZA')
 
     github_repo_path = 'banking_data'
     customer_file = f'{github_repo_path}/customers_{year}.parquet'
@@ -36,7 +120,7 @@ def generate_accounts(year):
         df_customers = pd.read_parquet(customer_file)
     except FileNotFoundError:
         print(f"Customer file {customer_file} not found. Exiting.")
-        return pd.DataFrame()
+        return None
 
     # Load previous years' customers (up to 3 years prior) for 3% re-opening
     previous_customers = []
@@ -78,29 +162,34 @@ def generate_accounts(year):
         'business': {'interest_rate': 0.005, 'monthly_charges': 50, 'transactions_rate': 0.02, 'negative_balance_rate': 0.07}
     }
 
-    def random_date(start_date, end_date):
-        delta = (end_date - start_date).days
-        return start_date + timedelta(days=np.random.randint(0, delta + 1))
+    def draw_opening_dates(df_group, max_accounts):
+        # Draw an opening date for every account a customer could get in one call;
+        # row i holds dates between max(opening_start, date_of_entry) and opening_end
+        entry_days = pd.to_datetime(df_group['date_of_entry']).values.astype('datetime64[D]')
+        starts = np.maximum(np.datetime64(opening_start), entry_days)
+        spans = (np.datetime64(opening_end) - starts).astype(np.int64) + 1
+        offsets = np.random.randint(0, spans[:, None], size=(len(df_group), max_accounts))
+        return starts[:, None] + offsets
 
     def select_realistic_account_type(customer_data, customer_type):
         if customer_type == 'Individual':
             income = customer_data.get('annual_income', 300000)
             if income < 100000:
-                return random.choices(['easy', 'savings'], weights=[0.7, 0.3])[0]
+                return weighted_choice(rnd, ACCOUNT_TYPES_UNDER_100K)
             elif income < 300000:
-                return random.choices(['savings', 'current', 'cheque'], weights=[0.5, 0.3, 0.2])[0]
+                return weighted_choice(rnd, ACCOUNT_TYPES_UNDER_300K)
             elif income < 600000:
-                return random.choices(['current', 'cheque', 'aspire', 'gold'], weights=[0.3, 0.2, 0.3, 0.2])[0]
+                return weighted_choice(rnd, ACCOUNT_TYPES_UNDER_600K)
             elif income < 1000000:
-                return random.choices(['gold', 'premium', 'current'], weights=[0.4, 0.4, 0.2])[0]
+                return weighted_choice(rnd, ACCOUNT_TYPES_UNDER_1M)
             else:
-                return random.choices(['platinum', 'premium', 'gold'], weights=[0.5, 0.3, 0.2])[0]
+                return weighted_choice(rnd, ACCOUNT_TYPES_1M_PLUS)
         return 'business'
 
     def determine_account_tier(account_type, income_level):
-        if account_type in ['premium', 'gold', 'platinum']:
+        if account_type in PREMIUM_ACCOUNT_TYPES:
             return 'premium'
-        elif account_type in ['business']:
+        elif account_type == 'business':
             return 'standard'
         elif income_level == 'low':
             return 'basic'
@@ -113,7 +202,7 @@ def generate_accounts(year):
             base_balance *= 5
         elif income_level == 'medium':
             base_balance *= 2
-        if account_type in ['premium', 'gold', 'platinum']:
+        if account_type in PREMIUM_ACCOUNT_TYPES:
             base_balance *= 3
         elif account_type == 'business':
             base_balance *= 10
@@ -121,22 +210,22 @@ def generate_accounts(year):
 
     def generate_transaction_volume(account_type, income_level):
         if account_type == 'business':
-            return random.randint(50, 200)
+            return rnd.randint(50, 200)
         elif income_level == 'high':
-            return random.randint(20, 80)
+            return rnd.randint(20, 80)
         elif income_level == 'medium':
-            return random.randint(10, 50)
+            return rnd.randint(10, 50)
         else:
-            return random.randint(5, 30)
+            return rnd.randint(5, 30)
 
     def generate_credit_limit(account_type, income_level):
-        if account_type in ['credit_card', 'overdraft_facility', 'business_credit_line']:
+        if account_type in CREDIT_ACCOUNT_TYPES:
             if income_level == 'high':
-                return round(random.uniform(50000, 200000), 2)
+                return round(rnd.uniform(50000, 200000), 2)
             elif income_level == 'medium':
-                return round(random.uniform(10000, 80000), 2)
+                return round(rnd.uniform(10000, 80000), 2)
             else:
-                return round(random.uniform(2000, 30000), 2)
+                return round(rnd.uniform(2000, 30000), 2)
         return 0.0
 
     def generate_account_requirements(customer_data, account_type):
@@ -149,73 +238,70 @@ def generate_accounts(year):
             'tax_certificate_provided': False,
             'minimum_deposit_met': True
         }
-        if account_type in ['premium', 'gold', 'platinum']:
-            requirements['proof_of_income_provided'] = random.random() < 0.9
-            requirements['bank_statements_provided'] = random.random() < 0.7
+        if account_type in PREMIUM_ACCOUNT_TYPES:
+            requirements['proof_of_income_provided'] = rnd.random() < 0.9
+            requirements['bank_statements_provided'] = rnd.random() < 0.7
         if account_type == 'business':
             requirements['business_registration_provided'] = True
-            requirements['tax_certificate_provided'] = random.random() < 0.8
-            requirements['bank_statements_provided'] = random.random() < 0.6
-        if customer_data.get('occupation') not in ['Unemployed', 'Student', 'Self-Employed']:
-            requirements['employer_letter_provided'] = random.random() < 0.6
-            requirements['proof_of_income_provided'] = random.random() < 0.8
+            requirements['tax_certificate_provided'] = rnd.random() < 0.8
+            requirements['bank_statements_provided'] = rnd.random() < 0.6
+        if customer_data.get('occupation') not in NO_EMPLOYER_OCCUPATIONS:
+            requirements['employer_letter_provided'] = rnd.random() < 0.6
+            requirements['proof_of_income_provided'] = rnd.random() < 0.8
         return requirements
 
     def determine_account_status(opening_date, customer_data, account_requirements):
         days_since_opening = (date.today() - opening_date).days
         if days_since_opening < 30:
             if not (account_requirements['proof_of_address_provided'] and account_requirements['minimum_deposit_met']):
-                return random.choices(['pending_verification', 'active'], weights=[0.3, 0.7])[0]
+                return weighted_choice(rnd, PENDING_STATUSES)
         risk_score = customer_data.get('risk_score', 0.5)
         if risk_score > 0.8:
-            return random.choices(['active', 'restricted', 'frozen'], weights=[0.6, 0.25, 0.15])[0]
+            return weighted_choice(rnd, HIGH_RISK_STATUSES)
         elif risk_score > 0.6:
-            return random.choices(['active', 'restricted'], weights=[0.85, 0.15])[0]
+            return weighted_choice(rnd, ELEVATED_RISK_STATUSES)
         if days_since_opening > 1095:
             closure_probability = 0.05 + (days_since_opening - 1095) / 10000
-            if random.random() < closure_probability:
+            if rnd.random() < closure_probability:
                 return 'closed'
-        return random.choices(['active', 'dormant'], weights=[0.92, 0.08])[0]
+        return weighted_choice(rnd, STANDARD_STATUSES)
 
     def generate_bundled_products(primary_account_type, customer_data):
         additional_products = []
-        if primary_account_type in ['premium', 'gold', 'platinum']:
-            if random.random() < 0.6:
+        if primary_account_type in PREMIUM_ACCOUNT_TYPES:
+            if rnd.random() < 0.6:
                 additional_products.append('investment_account')
-            if random.random() < 0.4:
+            if rnd.random() < 0.4:
                 additional_products.append('credit_card')
-            if random.random() < 0.3:
+            if rnd.random() < 0.3:
                 additional_products.append('overdraft_facility')
         if customer_data.get('customer_type') == 'Individual':
             age = calculate_age(customer_data.get('birth_date', date(1990, 1, 1)), year)
             if age < 25 and customer_data.get('occupation') == 'Student':
-                if random.random() < 0.8:
+                if rnd.random() < 0.8:
                     additional_products.append('student_card')
         elif customer_data.get('customer_type') == 'Company':
-            if random.random() < 0.5:
+            if rnd.random() < 0.5:
                 additional_products.append('business_credit_line')
-            if random.random() < 0.3:
+            if rnd.random() < 0.3:
                 additional_products.append('merchant_services')
-            if random.random() < 0.4:
+            if rnd.random() < 0.4:
                 additional_products.append('payroll_services')
         return ';'.join(additional_products) if additional_products else None
 
     def determine_opening_channel_and_details():
-        channels = ['branch', 'online', 'mobile_app', 'phone', 'agent']
-        weights = [0.85, 0.25, 0.15, 0.10, 0.05]
-        weights = [w / sum(weights) for w in weights]
-        opening_channel = random.choices(channels, weights=weights)[0]
+        opening_channel = weighted_choice(rnd, OPENING_CHANNEL_CHOICES)
         channel_details = {
             'opening_channel': opening_channel,
-            'requires_branch_visit': opening_channel in ['branch', 'agent'],
-            'digital_onboarding': opening_channel in ['online', 'mobile_app'],
-            'staff_assisted': opening_channel in ['branch', 'phone', 'agent'],
+            'requires_branch_visit': opening_channel in BRANCH_VISIT_CHANNELS,
+            'digital_onboarding': opening_channel in DIGITAL_CHANNELS,
+            'staff_assisted': opening_channel in STAFF_ASSISTED_CHANNELS,
             'verification_method': None,
             'instant_approval': False
         }
         if channel_details['digital_onboarding']:
-            channel_details['verification_method'] = random.choice(['biometric', 'document_upload', 'video_call'])
-            channel_details['instant_approval'] = random.random() < 0.7
+            channel_details['verification_method'] = rnd.choice(['biometric', 'document_upload', 'video_call'])
+            channel_details['instant_approval'] = rnd.random() < 0.7
         return channel_details
 
     # Set date range for account openings
@@ -229,31 +315,151 @@ def generate_accounts(year):
         opening_start = date(max(2015, year - 3), 1, 1)
         opening_end = date(year, 12, 31)
 
-    accounts = []
-    account_id_counter = 1
-
-    # Process customers (current and previous years)
-    df_individuals = df_customers[df_customers['customer_type'] == 'Individual'].copy()
-    df_companies = df_customers[df_customers['customer_type'] == 'Company'].copy()
-    individual_ids = df_individuals['customer_id'].values
-    max_partners = min(len(individual_ids) - 1, 3)
-
-    for _, row in tqdm(df_individuals.iterrows(), total=len(df_individuals), desc="Generating Individual Accounts"):
-        customer_id = row['customer_id']
-        date_of_entry = row['date_of_entry']
-        num_accounts = generate_accounts_with_relationships(row, year)
-        income_level = get_income_level(row)
-
-        for _ in range(num_accounts):
-            acc_type = select_realistic_account_type(row, 'Individual')
-            if acc_type != 'joint':
-                opening_date = random_date(max(opening_start, date_of_entry), opening_end)
+    os.makedirs(github_repo_path, exist_ok=True)
+    output_file = f'{github_repo_path}/accounts_{year}.parquet'
+    total_accounts = 0
+
+    # The with block closes the file even if generation fails part way
+    with pq.ParquetWriter(output_file, ACCOUNT_SCHEMA, compression='zstd') as writer:
+        def flush_accounts(batch):
+            # Write the pending rows as one record batch and release them
+            nonlocal total_accounts
+            if batch:
+                writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=ACCOUNT_SCHEMA))
+                total_accounts += len(batch)
+                batch.clear()
+
+        accounts = []
+        account_id_counter = 1
+
+        # Process customers (current and previous years)
+        df_individuals = df_customers[df_customers['customer_type'] == 'Individual']
+        df_companies = df_customers[df_customers['customer_type'] == 'Company']
+        individual_ids = df_individuals['customer_id'].values
+        individual_is_foreign = df_individuals['citizenship'].values != 'ZA'
+        max_partners = min(len(individual_ids) - 1, 3)
+
+        # Up to 4 own accounts plus 2 joint accounts per individual, 2 accounts per company
+        individual_opening_dates = draw_opening_dates(df_individuals, 6)
+        company_opening_dates = draw_opening_dates(df_companies, 2)
+        individual_account_counts = generate_accounts_with_relationships(df_individuals, year)
+        individual_income_levels = get_income_levels(df_individuals)
+        company_income_levels = get_income_levels(df_companies)
+        company_account_counts = generate_accounts_with_relationships(df_companies, year) if year != 2020 else np.ones(len(df_companies), dtype=np.int64)
+
+        for pos, (_, row) in enumerate(tqdm(df_individuals.iterrows(), total=len(df_individuals), desc="Generating Individual Accounts")):
+            customer_id = row['customer_id']
+            opening_dates = iter(individual_opening_dates[pos])
+            num_accounts = individual_account_counts[pos]
+            income_level = individual_income_levels[pos]
+
+            for _ in range(num_accounts):
+                acc_type = select_realistic_account_type(row, 'Individual')
+                if acc_type != 'joint':
+                    opening_date = next(opening_dates).item()
+                    requirements = generate_account_requirements(row, acc_type)
+                    account_status = determine_account_status(opening_date, row, requirements)
+                    branch_code = rnd.choice(branch_codes)
+                    charges = account_charges[acc_type]
+                    channel_details = determine_opening_channel_and_details()
+                    currency = 'ZAR' if rnd.random() < 0.95 else rnd.choice(['USD', 'EUR'])
+                    account_tier = determine_account_tier(acc_type, income_level)
+                    balance = generate_account_balance(acc_type, income_level)
+                    transaction_volume = generate_transaction_volume(acc_type, income_level)
+                    credit_limit = generate_credit_limit(acc_type, income_level)
+
+                    accounts.append({
+                        'account_id': f'ACC{year}{account_id_counter:07d}',
+                        'customer_id': customer_id,
+                        'account_type': acc_type,
+                        'opening_date': opening_date,
+                        'branch_code': branch_code,
+                        'kyc_verified': True,
+                        'fica_verified': row['citizenship'] != 'ZA',
+                        'expected_amount': round(np.random.lognormal(mean=8.5, sigma=1.2), 2),
+                        'account_status': account_status,
+                        'linked_joint_accounts': None,
+                        'interest_rate': charges['interest_rate'],
+                        'monthly_charges': charges['monthly_charges'],
+                        'transactions_rate': charges['transactions_rate'],
+                        'negative_balance_rate': charges['negative_balance_rate'],
+                        'bundled_products': generate_bundled_products(acc_type, row),
+                        'currency': currency,
+                        'account_tier': account_tier,
+                        'account_balance': balance,
+                        'transaction_volume': transaction_volume,
+                        'credit_limit': credit_limit,
+                        **requirements,
+                        **channel_details
+                    })
+                    account_id_counter += 1
+                    if len(accounts) >= ACCOUNT_BATCH_SIZE:
+                        flush_accounts(accounts)
+
+            joint_accounts_to_create = rnd.randint(0, 2) if year != 2020 else 0
+            for _ in range(joint_accounts_to_create):
+                # Partners are drawn by position from the other individuals: sample
+                # from n-1 slots and shift those at or past this row up by one
+                partner_positions = np.array(
+                    rnd.sample(range(len(individual_ids) - 1), min(rnd.randint(1, 3), max_partners)), dtype=np.int64
+                )
+                partner_positions[partner_positions >= pos] += 1
+                partners = individual_ids[partner_positions]
+                opening_date = next(opening_dates).item()
+                requirements = generate_account_requirements(row, 'joint')
+                account_status = determine_account_status(opening_date, row, requirements)
+                branch_code = rnd.choice(branch_codes)
+                charges = account_charges['joint']
+                channel_details = determine_opening_channel_and_details()
+                currency = 'ZAR' if rnd.random() < 0.95 else rnd.choice(['USD', 'EUR'])
+                account_tier = determine_account_tier('joint', income_level)
+                balance = generate_account_balance('joint', income_level)
+                transaction_volume = generate_transaction_volume('joint', income_level)
+                credit_limit = generate_credit_limit('joint', income_level)
+
+                accounts.append({
+                    'account_id': f'ACC{year}{account_id_counter:07d}',
+                    'customer_id': customer_id,
+                    'account_type': 'joint',
+                    'opening_date': opening_date,
+                    'branch_code': branch_code,
+                    'kyc_verified': True,
+                    'fica_verified': bool(individual_is_foreign[pos] or individual_is_foreign[partner_positions].any()),
+                    'expected_amount': min(round(np.random.lognormal(mean=8.5, sigma=1.2), 2), 100000),
+                    'account_status': account_status,
+                    'linked_joint_accounts': ';'.join(partners),
+                    'interest_rate': charges['interest_rate'],
+                    'monthly_charges': charges['monthly_charges'],
+                    'transactions_rate': charges['transactions_rate'],
+                    'negative_balance_rate': charges['negative_balance_rate'],
+                    'bundled_products': generate_bundled_products('joint', row),
+                    'currency': currency,
+                    'account_tier': account_tier,
+                    'account_balance': balance,
+                    'transaction_volume': transaction_volume,
+                    'credit_limit': credit_limit,
+                    **requirements,
+                    **channel_details
+                })
+                account_id_counter += 1
+                if len(accounts) >= ACCOUNT_BATCH_SIZE:
+                    flush_accounts(accounts)
+
+        for pos, (_, row) in enumerate(tqdm(df_companies.iterrows(), total=len(df_companies), desc="Generating Company Accounts")):
+            customer_id = row['customer_id']
+            opening_dates = iter(company_opening_dates[pos])
+            num_accounts = company_account_counts[pos]
+            income_level = company_income_levels[pos]
+
+            for _ in range(num_accounts):
+                acc_type = 'business'
+                opening_date = next(opening_dates).item()
                 requirements = generate_account_requirements(row, acc_type)
                 account_status = determine_account_status(opening_date, row, requirements)
-                branch_code = random.choice(branch_codes)
+                branch_code = rnd.choice(branch_codes)
                 charges = account_charges[acc_type]
                 channel_details = determine_opening_channel_and_details()
-                currency = 'ZAR' if random.random() < 0.95 else random.choice(['USD', 'EUR'])
+                currency = 'ZAR' if rnd.random() < 0.9 else rnd.choice(['USD', 'EUR'])
                 account_tier = determine_account_tier(acc_type, income_level)
                 balance = generate_account_balance(acc_type, income_level)
                 transaction_volume = generate_transaction_volume(acc_type, income_level)
@@ -266,8 +472,8 @@ def generate_accounts(year):
                     'opening_date': opening_date,
                     'branch_code': branch_code,
                     'kyc_verified': True,
-                    'fica_verified': row['citizenship'] != 'ZA',
-                    'expected_amount': round(np.random.lognormal(mean=8.5, sigma=1.2), 2),
+                    'fica_verified': None,
+                    'expected_amount': round(rnd.uniform(10000, 1000000), 2),
                     'account_status': account_status,
                     'linked_joint_accounts': None,
                     'interest_rate': charges['interest_rate'],
@@ -284,116 +490,31 @@ def generate_accounts(year):
                     **channel_details
                 })
                 account_id_counter += 1
+                if len(accounts) >= ACCOUNT_BATCH_SIZE:
+                    flush_accounts(accounts)
 
-        joint_accounts_to_create = random.randint(0, 2) if year != 2020 else 0
-        for _ in range(joint_accounts_to_create):
-            partners = np.random.choice([cid for cid in individual_ids if cid != customer_id], 
-                                      size=min(random.randint(1, 3), max_partners), replace=False)
-            opening_date = random_date(max(opening_start, date_of_entry), opening_end)
-            requirements = generate_account_requirements(row, 'joint')
-            account_status = determine_account_status(opening_date, row, requirements)
-            branch_code = random.choice(branch_codes)
-            charges = account_charges['joint']
-            channel_details = determine_opening_channel_and_details()
-            currency = 'ZAR' if random.random() < 0.95 else random.choice(['USD', 'EUR'])
-            account_tier = determine_account_tier('joint', income_level)
-            balance = generate_account_balance('joint', income_level)
-            transaction_volume = generate_transaction_volume('joint', income_level)
-            credit_limit = generate_credit_limit('joint', income_level)
-
-            accounts.append({
-                'account_id': f'ACC{year}{account_id_counter:07d}',
-                'customer_id': customer_id,
-                'account_type': 'joint',
-                'opening_date': opening_date,
-                'branch_code': branch_code,
-                'kyc_verified': True,
-                'fica_verified': any(df_individuals[df_individuals['customer_id'].isin([customer_id] + list(partners))]['citizenship'] != 'ZA'),
-                'expected_amount': min(round(np.random.lognormal(mean=8.5, sigma=1.2), 2), 100000),
-                'account_status': account_status,
-                'linked_joint_accounts': ';'.join(partners),
-                'interest_rate': charges['interest_rate'],
-                'monthly_charges': charges['monthly_charges'],
-                'transactions_rate': charges['transactions_rate'],
-                'negative_balance_rate': charges['negative_balance_rate'],
-                'bundled_products': generate_bundled_products('joint', row),
-                'currency': currency,
-                'account_tier': account_tier,
-                'account_balance': balance,
-                'transaction_volume': transaction_volume,
-                'credit_limit': credit_limit,
-                **requirements,
-                **channel_details
-            })
-            account_id_counter += 1
-
-    for _, row in tqdm(df_companies.iterrows(), total=len(df_companies), desc="Generating Company Accounts"):
-        customer_id = row['customer_id']
-        date_of_entry = row['date_of_entry']
-        num_accounts = random.choices([1, 2], weights=[0.8, 0.2])[0] if year != 2020 else 1
-        income_level = get_income_level(row)
-
-        for _ in range(num_accounts):
-            acc_type = 'business'
-            opening_date = random_date(max(opening_start, date_of_entry), opening_end)
-            requirements = generate_account_requirements(row, acc_type)
-            account_status = determine_account_status(opening_date, row, requirements)
-            branch_code = random.choice(branch_codes)
-            charges = account_charges[acc_type]
-            channel_details = determine_opening_channel_and_details()
-            currency = 'ZAR' if random.random() < 0.9 else random.choice(['USD', 'EUR'])
-            account_tier = determine_account_tier(acc_type, income_level)
-            balance = generate_account_balance(acc_type, income_level)
-            transaction_volume = generate_transaction_volume(acc_type, income_level)
-            credit_limit = generate_credit_limit(acc_type, income_level)
-
-            accounts.append({
-                'account_id': f'ACC{year}{account_id_counter:07d}',
-                'customer_id': customer_id,
-                'account_type': acc_type,
-                'opening_date': opening_date,
-                'branch_code': branch_code,
-                'kyc_verified': True,
-                'fica_verified': None,
-                'expected_amount': round(random.uniform(10000, 1000000), 2),
-                'account_status': account_status,
-                'linked_joint_accounts': None,
-                'interest_rate': charges['interest_rate'],
-                'monthly_charges': charges['monthly_charges'],
-                'transactions_rate': charges['transactions_rate'],
-                'negative_balance_rate': charges['negative_balance_rate'],
-                'bundled_products': generate_bundled_products(acc_type, row),
-                'currency': currency,
-                'account_tier': account_tier,
-                'account_balance': balance,
-                'transaction_volume': transaction_volume,
-                'credit_limit': credit_limit,
-                **requirements,
-                **channel_details
-            })
-            account_id_counter += 1
-
-    df_accounts = pd.DataFrame(accounts)
-    os.makedirs(github_repo_path, exist_ok=True)
-    output_file = f'{github_repo_path}/accounts_{year}.parquet'
-    df_accounts.to_parquet(output_file, index=False)
+        flush_accounts(accounts)
 
-    print(f"Generated {len(df_accounts)} accounts for year {year}.")
+    print(f"Generated {total_accounts} accounts for year {year}.")
     print(f"Saved to {output_file}")
 
-    return df_accounts
-
-def generate_accounts_with_relationships(customer_data, year):
-    customer_type = customer_data['customer_type']
-    if customer_type == 'Individual':
-        age = calculate_age(customer_data.get('birth_date', date(1990, 1, 1)), year)
-        income_level = get_income_level(customer_data)
-        if income_level == 'high' and age > 35:
-            return random.choices([1, 2, 3, 4], weights=[0.2, 0.4, 0.3, 0.1])[0]
-        elif income_level == 'medium' and age > 25:
-            return random.choices([1, 2, 3], weights=[0.4, 0.4, 0.2])[0]
-        return random.choices([1, 2], weights=[0.7, 0.3])[0]
-    return random.choices([1, 2], weights=[0.8, 0.2])[0]
+    return output_file
+
+def generate_accounts_with_relationships(df_group, year):
+    # Number of own accounts for every customer in df_group, drawn with one
+    # np.random.choice per band: older high earners hold up to 4 accounts,
+    # established medium earners up to 3, everyone else 1-2
+    n = len(df_group)
+    if n == 0 or (df_group['customer_type'] != 'Individual').all():
+        return np.random.choice([1, 2], size=n, p=[0.8, 0.2])
+    ages = year - pd.to_datetime(df_group['birth_date']).dt.year.to_numpy()
+    incomes = df_group['annual_income'].to_numpy()
+    high_band = (incomes >= 600000) & (ages > 35)
+    medium_band = (incomes >= 100000) & (incomes < 600000) & (ages > 25)
+    counts = np.random.choice([1, 2], size=n, p=[0.7, 0.3])
+    counts[high_band] = np.random.choice([1, 2, 3, 4], size=high_band.sum(), p=[0.2, 0.4, 0.3, 0.1])
+    counts[medium_band] = np.random.choice([1, 2, 3], size=medium_band.sum(), p=[0.4, 0.4, 0.2])
+    return counts
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate account data for a specific year")
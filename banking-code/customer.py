@@ -1,232 +1,422 @@
 import pandas as pd
 import numpy as np
-import random
 from faker import Faker
 from datetime import date, timedelta
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, lru_cache
 from tqdm import tqdm
 from occupations import get_occupations_data
 from cities import get_cities_data
-from phone_numbers import generate_phone_number
-from names import generate_name
+from phone_numbers import generate_phone_numbers
+from names import generate_names
+
+# Upper bound on how many values are pre-generated per Faker provider
+FAKER_POOL_SIZE = 5000
+
+# Individuals generated per batch (and per worker task when run in parallel)
+INDIVIDUAL_BATCH_SIZE = 1000
+
+# Years with fewer individuals than this are generated in-process
+PARALLEL_MIN_INDIVIDUALS = 5000
+
+# Education levels, their population weights and their rank for comparing
+# against an occupation's required education
+EDUCATION_LEVELS = [
+    'No Formal Education', 'Primary Education', 'High School Incomplete', 'High School Completed',
+    'Certificate', 'Diploma', 'Bachelor Degree', 'Honours Degree', 'Masters Degree', 'Doctorate/PhD'
+]
+EDUCATION_PROBS = np.array([0.10, 0.15, 0.20, 0.30, 0.10, 0.08, 0.05, 0.015, 0.01, 0.005])
+EDUCATION_PROBS = EDUCATION_PROBS / np.sum(EDUCATION_PROBS)
+EDUCATION_HIERARCHY = {edu: idx for idx, edu in enumerate(EDUCATION_LEVELS)}
+
+# Age distribution of individual customers
+AGE_RANGES = np.array([22, 30, 37, 46, 55, 65, 75], dtype=np.int8)
+AGE_WEIGHTS = np.array([0.15, 0.25, 0.22, 0.18, 0.12, 0.06, 0.02])
+
+# Reasons for opening an account
+INDIVIDUAL_REASONS = [
+    'Personal Savings', 'Business Transactions', 'Salary Deposit', 'Investment Account',
+    'Loan Application', 'Home Purchase', 'Education Funding', 'Travel Expenses'
+]
+COMPANY_REASONS = [
+    'Business Transactions', 'Payroll Management', 'Supplier Payments', 'Investment Account',
+    'Tax Payments', 'Expansion Funding', 'Operational Expenses'
+]
+
+# Occupations without employment income (higher risk, family-supported)
+NO_INCOME_OCCUPATIONS = ['Unemployed', 'Student']
+
+# Individual emails are '<name><number>@<domain>', built from the
+# customer's own name with non-alphanumerics stripped
+EMAIL_DOMAINS = ['gmail.com', 'outlook.com', 'yahoo.com', 'hotmail.com']
+EMAIL_STRIP_RE = re.compile(r'[^a-zA-Z0-9]')
+
+# Low-cardinality text columns stored as pandas categoricals (dictionary
+# encoded in the parquet file)
+CATEGORY_COLUMNS = [
+    'customer_type', 'citizenship', 'id_type', 'visa_type', 'occupation', 'source_of_funds',
+    'marital_status', 'nationality', 'gender', 'preferred_contact_method', 'education_level',
+    'ethnicity', 'reason_for_opening_account', 'industry_risk_rating'
+]
+
+# Rows per parquet row group in the customer file
+PARQUET_ROW_GROUP_SIZE = 8192
+
+@lru_cache(maxsize=1)
+def get_reference_tables():
+    # Occupation and city tables with their derived lookups. They do not
+    # depend on the year, so they are built once per process
+    occupations, income_ranges, occupation_probs = get_occupations_data()
+    provinces, cities, province_probs = get_cities_data()
+
+    # Per-occupation lookups (no-income flag, income range bounds)
+    occupations_arr = np.array(occupations, dtype=object)
+    city_lens = np.array([len(cities[province]) for province in provinces])
+    city_arr = np.full((len(provinces), city_lens.max()), '', dtype=f'U{max(len(c) for p in provinces for c in cities[p])}')
+    for row, province in enumerate(provinces):
+        city_arr[row, :city_lens[row]] = cities[province]
+
+    # Occupation weights per education level: the occupations whose required
+    # education is met or exceeded, in proportion to occupation_probs
+    education_ranks = np.array([EDUCATION_HIERARCHY[education] for education in EDUCATION_LEVELS])
+    required_ranks = np.array([EDUCATION_HIERARCHY.get(income_ranges[occ]['required_education'], 0) for occ in occupations])
+    occupation_weights = np.where(education_ranks[:, None] >= required_ranks, occupation_probs, 0.0)
+    no_valid_occupation = occupation_weights.sum(axis=1) == 0
+    occupation_weights[no_valid_occupation, occupations.index('Unemployed Unskilled')] = 1.0  # Fallback for no valid occupations
+    occupation_weights /= occupation_weights.sum(axis=1, keepdims=True)
+    return {
+        'occupations_arr': occupations_arr,
+        'no_income': np.isin(occupations_arr, NO_INCOME_OCCUPATIONS),
+        'income_low': np.array([income_ranges[occ]['range'][0] for occ in occupations], dtype=np.float64),
+        'income_high': np.array([income_ranges[occ]['range'][1] for occ in occupations], dtype=np.float64),
+        'provinces': provinces,
+        'cities': cities,
+        'province_probs': province_probs,
+        # Cities as a padded (province, city) array with each row's length
+        'city_arr': city_arr,
+        'city_lens': city_lens,
+        # Cumulative occupation weights (education level, occupation) and the
+        # last occupation each education level can draw
+        'occupation_cdf': np.cumsum(occupation_weights, axis=1),
+        'last_valid_occupation': occupation_weights.shape[1] - 1 - np.argmax(occupation_weights[:, ::-1] > 0, axis=1),
+    }
+
+@lru_cache(maxsize=None)
+def get_faker_pools(pool_size):
+    # Street addresses, companies, company emails and names from a
+    # zu_ZA Faker, built on first use. Years with at least FAKER_POOL_SIZE
+    # customers all share one entry
+    fake = Faker('zu_ZA')
+    return tuple(
+        np.array([provider() for _ in range(pool_size)], dtype=object)
+        for provider in (fake.street_address, fake.company, fake.company_email, fake.name)
+    )
+
+def sample_pool(rng, pool, size):
+    return pool[rng.integers(0, len(pool), size=size)]
+
+def name_emails(rng, full_names):
+    # An email per person from their own name, a number from 0-9998 and a
+    # random domain. Names come from small pools, so each distinct name is
+    # cleaned once
+    unique_names, name_idx = np.unique(full_names.astype(str), return_inverse=True)
+    email_users = np.array([EMAIL_STRIP_RE.sub('', name.lower()) for name in unique_names], dtype=object)
+    numbers = rng.integers(0, 9999, size=len(full_names)).astype(str).astype(object)
+    return email_users[name_idx] + numbers + '@' + rng.choice(EMAIL_DOMAINS, size=len(full_names)).astype(object)
+
+def redraw_duplicate_emails(rng, full_names, emails):
+    # Later holders of an address already in use get a fresh number and
+    # domain until every address is distinct
+    duplicated = pd.Series(emails).duplicated().to_numpy()
+    while duplicated.any():
+        emails[duplicated] = name_emails(rng, full_names[duplicated])
+        duplicated = pd.Series(emails).duplicated().to_numpy()
+    return emails
+
+def random_digit_strings(rng, size, length):
+    # size strings of length random digits: the uint8 ASCII codes of each row
+    # are reinterpreted as one fixed-width bytes string
+    digits = rng.integers(0, 10, size=(size, length), dtype=np.uint8) + np.uint8(ord('0'))
+    return digits.view(f'S{length}').ravel().astype(str)
+
+def sequential_ids(prefix, count):
+    # prefix followed by the 6-digit zero-padded numbers 1..count
+    return np.char.add(prefix, np.char.zfill(np.arange(1, count + 1).astype(str), 6))
+
+def sample_addresses(rng, ctx, street_pool, size):
+    # '<street>, <city>, <province>, South Africa' for size customers: the
+    # province is drawn by weight, the city gathered from the padded city
+    # array, and the parts joined with np.char.add
+    province_idx = rng.choice(len(ctx['provinces']), size=size, p=ctx['province_probs'])
+    city_idx = (rng.random(size) * ctx['city_lens'][province_idx]).astype(np.int64)
+    parts = [
+        sample_pool(rng, street_pool, size).astype(str), ', ',
+        ctx['city_arr'][province_idx, city_idx], ', ',
+        np.asarray(ctx['provinces'])[province_idx], ', South Africa'
+    ]
+    addresses = parts[0]
+    for part in parts[1:]:
+        addresses = np.char.add(addresses, part)
+    return addresses
+
+def random_dates(rng, start_date, end_date, size):
+    # Uniform dates between start_date and end_date (inclusive) as date objects
+    offsets = rng.integers(0, (end_date - start_date).days + 1, size=size)
+    return (np.datetime64(start_date) + offsets).astype(object)
+
+def random_entry_dates(rng, year, size):
+    # Month 1-12 and day 1-28 of year, assembled with datetime64 arithmetic
+    months = np.datetime64(f'{year}-01', 'M') + rng.integers(0, 12, size=size)
+    days = rng.integers(0, 28, size=size)
+    return months.astype('datetime64[D]') + days
+
+def compact_customer_dtypes(df):
+    # Store repeated strings as categoricals before the frame is written.
+    # Numeric columns are already drawn at their narrow dtypes (int8 age,
+    # int32 income, float32 risk score)
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    return df
 
-def generate_customer_data(year):
+def generate_income_and_risk(rng, ctx, ages, occupation_idx):
+    # Income scales with age from a uniform draw in the occupation's range;
+    # risk adds fixed penalties for low income, youth and no employment.
+    # Both are updated in place so each column is a single buffer
+    income_low, income_high = ctx['income_low'], ctx['income_high']
+    base_income = rng.uniform(income_low[occupation_idx], income_high[occupation_idx])
+    age_factor = ages - 25.0
+    age_factor *= 0.02
+    age_factor += 1
+    base_income *= age_factor
+    annual_incomes = base_income.astype(np.int32)
+
+    risk_scores = rng.random(len(ages), dtype=np.float32)
+    risk_scores *= 0.1
+    risk_scores += 0.1
+    risk_scores[annual_incomes < 200000] += 0.2
+    risk_scores[ages < 25] += 0.1
+    risk_scores[ctx['no_income'][occupation_idx]] += 0.15
+    np.round(risk_scores, 3, out=risk_scores)
+    np.minimum(risk_scores, 0.99, out=risk_scores)
+    return annual_incomes, risk_scores
+
+def generate_batch_individuals(rng, ctx, batch_size):
+    # Every column is drawn for the whole batch at once; ctx holds the
+    # reference tables and the year's Faker pools (see generate_customer_data)
+    year = ctx['year']
+    occupations_arr = ctx['occupations_arr']
+    street_pool, employer_pool = ctx['street_pool'], ctx['employer_pool']
+    name_pool = ctx['name_pool']
+
+    ages = rng.choice(AGE_RANGES, size=batch_size, p=AGE_WEIGHTS)
+    genders = rng.choice(['M', 'F'], size=batch_size, p=[0.49, 0.51])
+    education_idx = rng.choice(len(EDUCATION_LEVELS), size=batch_size, p=EDUCATION_PROBS)
+    education_batch = np.array(EDUCATION_LEVELS)[education_idx]
+
+    # Assign occupations by inverting each row's cumulative occupation weights
+    # for its education level; zero-weight occupations are never reached
+    below = ctx['occupation_cdf'][education_idx] <= rng.random(batch_size)[:, None]
+    occupation_idx = np.minimum(below.sum(axis=1), ctx['last_valid_occupation'][education_idx])
+    occupations_batch = occupations_arr[occupation_idx]
+
+    # Generate name, nationality, citizenship, and ethnicity
+    full_names, nationalities, citizenships, ethnicities = generate_names(batch_size, rng)
+    is_sa = nationalities == 'South Africa'
+
+    # Generate income and risk
+    annual_incomes, risk_scores = generate_income_and_risk(rng, ctx, ages, occupation_idx)
+
+    # Generate other fields
+    birth_offsets = rng.integers(0, 365, size=batch_size)
+    birth_dates = (np.datetime64(date.today()) - (ages.astype(np.int64) * 365 + birth_offsets)).astype(object)
+    id_numbers = random_digit_strings(rng, batch_size, 13)
+    tax_id_numbers = random_digit_strings(rng, batch_size, 10)
+    addresses = sample_addresses(rng, ctx, street_pool, batch_size)
+
+    # Acquisition date; in 2020, 15% of individuals joined before the
+    # lockdown started on 26 March
+    dates_of_entry = random_entry_dates(rng, year, batch_size)
+    if year == 2020:
+        lockdown_offsets = rng.integers(0, (date(year, 3, 26) - date(year, 1, 1)).days + 1, size=batch_size)
+        in_lockdown = rng.random(batch_size) < 0.15
+        dates_of_entry = np.where(in_lockdown, np.datetime64(date(year, 1, 1)) + lockdown_offsets, dates_of_entry)
+    dates_of_entry = dates_of_entry.astype(object)
+
+    # Generate phone number
+    phone_numbers = generate_phone_numbers(nationalities, rng)
+
+    # 30% work for the bank, the rest for a pooled company; one gather
+    employer_idx = rng.integers(1, len(employer_pool), size=batch_size)
+    employer_idx[rng.random(batch_size) < 0.3] = 0
+
+    # Passport and visa expiry dates fall within the next 3 and 2 years
+    today = date.today()
+    expiry_dates = random_dates(rng, today + timedelta(days=1), today + timedelta(days=3 * 365), batch_size)
+    visa_expiry_dates = random_dates(rng, today + timedelta(days=1), today + timedelta(days=2 * 365), batch_size)
+
+    # 10% of individuals get a next of kin from the name pool
+    next_of_kin = np.full(batch_size, None, dtype=object)
+    next_of_kin_positions = rng.choice(batch_size, size=int(batch_size * 0.1), replace=False)
+    next_of_kin[next_of_kin_positions] = sample_pool(rng, name_pool, len(next_of_kin_positions))
+
+    # One array (or a scalar for constant columns) per column; batches are
+    # joined column-wise by concat_batch_columns
+    return {
+        'customer_type': 'Individual',
+        'full_name': full_names,
+        'birth_date': birth_dates,
+        'citizenship': citizenships,
+        'residential_address': addresses,
+        'commercial_address': None,
+        'email': name_emails(rng, full_names),
+        'phone_number': phone_numbers,
+        'id_type': np.where(is_sa, 'National ID', 'Passport'),
+        'id_number': id_numbers,
+        'expiry_date': np.where(is_sa, None, expiry_dates),
+        'visa_type': np.where(is_sa, None, 'Work'),
+        'visa_expiry_date': np.where(is_sa, None, visa_expiry_dates),
+        'is_pep': rng.random(batch_size) < 0.01,
+        'sanctioned_country': False,
+        'risk_score': risk_scores,
+        'tax_id_number': tax_id_numbers,
+        'occupation': occupations_batch,
+        'employer_name': employer_pool[employer_idx],
+        'source_of_funds': np.where(ctx['no_income'][occupation_idx], 'Family Support', 'Employment Income'),
+        'marital_status': rng.choice(['Single', 'Married', 'Divorced'], size=batch_size),
+        'nationality': nationalities,
+        'gender': genders,
+        'preferred_contact_method': rng.choice(['Email', 'Phone', 'SMS'], size=batch_size),
+        'next_of_kin': next_of_kin,
+        'date_of_entry': dates_of_entry,
+        'annual_income': annual_incomes,
+        'age': ages,
+        'education_level': education_batch,
+        'ethnicity': ethnicities,
+        'reason_for_opening_account': rng.choice(INDIVIDUAL_REASONS, size=batch_size)
+    }
+
+def concat_batch_columns(batches):
+    # Join per-batch column dicts into one array per column, repeating the
+    # scalar columns to each batch's length
+    sizes = [len(batch['full_name']) for batch in batches]
+    return {
+        column: np.concatenate([
+            np.full(size, batch[column]) if np.ndim(batch[column]) == 0 else np.asarray(batch[column])
+            for batch, size in zip(batches, sizes)
+        ])
+        for column in batches[0]
+    }
+
+def _generate_individuals_chunk(task):
+    # Process pool entry point: build one batch from its own SeedSequence child
+    ctx, batch_size, seed = task
+    return generate_batch_individuals(np.random.default_rng(seed), ctx, batch_size)
+
+def generate_customer_data(year, n_workers=None):
     # Initialize seeds for reproducibility
     seed_bytes = os.urandom(4)
     seed_int = int.from_bytes(seed_bytes, byteorder='big')
-    random.seed(seed_int)
-    np.random.seed(seed_int)
+    seed_seq = np.random.SeedSequence(seed_int)
+    rng = np.random.default_rng(seed_seq)
     Faker.seed(seed_int)
-    fake = Faker('zu_ZA')
-    faker_instances = {'zu_ZA': fake}
 
     # Customer counts based on year
     if year == 2020:
-        num_individuals = random.randint(20, 50)
-        num_companies = random.randint(0, 5)
+        num_individuals = rng.integers(20, 51)
+        num_companies = rng.integers(0, 6)
         print("Note: 2020 year - Reduced registrations due to COVID-19 lockdowns in South Africa.")
     elif year == 2021:
-        num_individuals = random.randint(13000, 18000)
-        num_companies = random.randint(1, 10)
+        num_individuals = rng.integers(13000, 18001)
+        num_companies = rng.integers(1, 11)
         print("Note: 2021 year - Recovery phase post-COVID.")
     elif year in (2022, 2023):
-        num_individuals = random.randint(20000, 25000)
-        num_companies = random.randint(1, 10)
+        num_individuals = rng.integers(20000, 25001)
+        num_companies = rng.integers(1, 11)
     else:
-        num_individuals = random.randint(15000, 22000)
-        num_companies = random.randint(1, 10)
-
-    # Pre-compute education levels
-    education_levels = [
-        'No Formal Education', 'Primary Education', 'High School Incomplete', 'High School Completed',
-        'Certificate', 'Diploma', 'Bachelor Degree', 'Honours Degree', 'Masters Degree', 'Doctorate/PhD'
-    ]
-    education_probs = np.array([0.10, 0.15, 0.20, 0.30, 0.10, 0.08, 0.05, 0.015, 0.01, 0.005])
-    education_probs = education_probs / np.sum(education_probs)
-
-    # Education hierarchy for comparison
-    education_hierarchy = {edu: idx for idx, edu in enumerate(education_levels)}
-
-    # Pre-compute age distribution
-    age_ranges = np.array([22, 30, 37, 46, 55, 65, 75])
-    age_weights = np.array([0.15, 0.25, 0.22, 0.18, 0.12, 0.06, 0.02])
-
-    # Pre-compute reasons for opening account
-    individual_reasons = [
-        'Personal Savings', 'Business Transactions', 'Salary Deposit', 'Investment Account',
-        'Loan Application', 'Home Purchase', 'Education Funding', 'Travel Expenses'
-    ]
-    company_reasons = [
-        'Business Transactions', 'Payroll Management', 'Supplier Payments', 'Investment Account',
-        'Tax Payments', 'Expansion Funding', 'Operational Expenses'
-    ]
-
-    # Load external data
-    occupations, income_ranges, occupation_probs = get_occupations_data()
-    provinces, cities, province_probs = get_cities_data()
-
-    def generate_batch_individuals(batch_size):
-        ages = np.random.choice(age_ranges, size=batch_size, p=age_weights)
-        genders = np.random.choice(['M', 'F'], size=batch_size, p=[0.49, 0.51])
-        education_batch = np.random.choice(education_levels, size=batch_size, p=education_probs)
-
-        # Initialize occupations_batch
-        occupations_batch = [None] * batch_size
-
-        # Assign occupations based on education
-        for i in range(batch_size):
-            education = education_batch[i]
-            # Filter occupations where the required education level is met or exceeded
-            valid_occupations = [
-                occ for occ in occupations
-                if education_hierarchy.get(education, 0) >= education_hierarchy.get(income_ranges[occ]['required_education'], 0)
-            ]
-            if not valid_occupations:
-                valid_occupations = ['Unemployed Unskilled']  # Fallback for no valid occupations
-            # Use probabilities proportional to original occupation_probs for valid occupations
-            valid_indices = [occupations.index(occ) for occ in valid_occupations]
-            valid_probs = occupation_probs[valid_indices]
-            valid_probs = valid_probs / valid_probs.sum()  # Normalize
-            occupations_batch[i] = np.random.choice(valid_occupations, p=valid_probs)
-
-        provinces_batch = np.random.choice(provinces, size=batch_size, p=province_probs)
-
-        results = []
-        for i in range(batch_size):
-            idx = len(results) + 1
-            age = int(ages[i])
-            gender = genders[i]
-            occupation = occupations_batch[i]
-            province = provinces_batch[i]
-            education = education_batch[i]
-
-            # Generate name, nationality, citizenship, and ethnicity
-            full_name, nationality, citizenship, ethnicity = generate_name()
-
-            # Generate income and risk
-            income_range = income_ranges[occupation]['range']
-            annual_income = int(np.random.uniform(*income_range) * (1 + (age - 25) * 0.02))
-            base_risk = 0.1
-            if annual_income < 200000:
-                base_risk += 0.2
-            if age < 25:
-                base_risk += 0.1
-            if occupation in ['Unemployed', 'Student']:
-                base_risk += 0.15
-            risk_score = min(round(base_risk + np.random.random() * 0.1, 3), 0.99)
-
-            # Generate other fields
-            birth_date = date.today() - timedelta(days=age*365 + random.randint(0, 364))
-            id_number = f"{''.join([str(random.randint(0,9)) for _ in range(13)])}"
-            city = random.choice(cities[province])
-            address = f"{fake.street_address()}, {city}, {province}, South Africa"
-
-            # Acquisition date
-            if year == 2020 and random.random() < 0.15:
-                date_of_entry = fake.date_between(start_date=date(year, 1, 1), end_date=date(year, 3, 26))
-            else:
-                month = random.randint(1, 12)
-                day = random.randint(1, 28)
-                date_of_entry = date(year, month, day)
-
-            # Generate phone number
-            phone_number = generate_phone_number(nationality, faker_instances)
-
-            results.append({
-                'customer_id': f'IND{year % 100}{idx:06d}',
-                'customer_type': 'Individual',
-                'full_name': full_name,
-                'birth_date': birth_date,
-                'citizenship': citizenship,
-                'residential_address': address,
-                'commercial_address': None,
-                'email': fake.email(),
-                'phone_number': phone_number,
-                'id_type': 'National ID' if nationality == 'South Africa' else 'Passport',
-                'id_number': id_number,
-                'expiry_date': None if nationality == 'South Africa' else fake.future_date(end_date='+3y'),
-                'visa_type': None if nationality == 'South Africa' else 'Work',
-                'visa_expiry_date': None if nationality == 'South Africa' else fake.future_date(end_date='+2y'),
-                'is_pep': random.random() < 0.01,
-                'sanctioned_country': False,
-                'risk_score': risk_score,
-                'tax_id_number': ''.join([str(random.randint(0,9)) for _ in range(10)]),
-                'occupation': occupation,
-                'employer_name': 'Standard Bank' if random.random() < 0.3 else fake.company(),
-                'source_of_funds': 'Employment Income' if occupation not in ['Student', 'Unemployed'] else 'Family Support',
-                'marital_status': random.choice(['Single', 'Married', 'Divorced']),
-                'nationality': nationality,
-                'gender': gender,
-                'preferred_contact_method': random.choice(['Email', 'Phone', 'SMS']),
-                'next_of_kin': None,
-                'date_of_entry': date_of_entry,
-                'annual_income': annual_income,
-                'age': age,
-                'education_level': education,
-                'ethnicity': ethnicity,
-                'reason_for_opening_account': random.choice(individual_reasons)
-            })
-
-        return results
+        num_individuals = rng.integers(15000, 22001)
+        num_companies = rng.integers(1, 11)
+
+    # Customers sample from pools of Faker values instead of calling Faker
+    # per row; the pools are shared by every year generated in this process
+    pool_size = max(1, min(FAKER_POOL_SIZE, num_individuals + num_companies))
+    street_pool, company_pool, company_email_pool, name_pool = get_faker_pools(pool_size)
+
+    # Everything generate_batch_individuals needs, kept picklable so batches
+    # can be built in worker processes
+    ctx = {
+        **get_reference_tables(),
+        'year': year,
+        'street_pool': street_pool,
+        'company_pool': company_pool,
+        'name_pool': name_pool,
+        # Employers: index 0 is the bank itself, the rest are the Faker companies
+        'employer_pool': np.concatenate([np.array(['Standard Bank'], dtype=object), company_pool]),
+    }
 
     def generate_batch_companies(batch_size):
-        results = []
-        for i in range(batch_size):
-            idx = len(results) + 1
-            company_name = fake.company()
-            age = random.randint(1, 20)
-            employees = random.randint(10, 100)
-            turnover = random.randint(5000000, 50000000)
-            province = np.random.choice(provinces, p=province_probs)
-            city = random.choice(cities[province])
-            risk_score = round(0.15 + np.random.random() * 0.2, 3)
-            date_of_entry = date(year, random.randint(1, 12), random.randint(1, 28))
-            phone_number = generate_phone_number('South Africa', faker_instances)
-
-            results.append({
-                'customer_id': f'COM{year % 100}{idx:06d}',
-                'customer_type': 'Company',
-                'full_name': company_name,
-                'birth_date': None,
-                'citizenship': 'ZA',
-                'residential_address': None,
-                'commercial_address': f"{fake.street_address()}, {city}, {province}, South Africa",
-                'email': fake.company_email(),
-                'phone_number': phone_number,
-                'id_type': 'Registration Number',
-                'id_number': f"{random.randint(1900, year)}/{random.randint(100000, 999999)}/{random.randint(1, 99)}",
-                'expiry_date': None,
-                'visa_type': None,
-                'visa_expiry_date': None,
-                'is_pep': False,
-                'sanctioned_country': False,
-                'risk_score': risk_score,
-                'tax_id_number': ''.join([str(random.randint(0,9)) for _ in range(10)]),
-                'occupation': random.choice(['Retail', 'Manufacturing', 'Finance', 'IT']),
-                'employer_name': None,
-                'source_of_funds': 'Business Income',
-                'marital_status': None,
-                'nationality': 'South Africa',
-                'gender': None,
-                'preferred_contact_method': 'Email',
-                'next_of_kin': fake.name(),
-                'date_of_entry': date_of_entry,
-                'annual_income': turnover,
-                'age': age,
-                'education_level': None,
-                'ethnicity': None,
-                'reason_for_opening_account': random.choice(company_reasons),
-                'company_age': age,
-                'number_of_employees': employees,
-                'annual_turnover': turnover,
-                'directors_count': random.randint(1, 3),
-                'shareholders_count': random.randint(1, 5),
-                'bee_level': random.randint(1, 8),
-                'vat_registered': random.random() < 0.8,
-                'industry_risk_rating': random.choice(['Low', 'Medium', 'High'])
-            })
-
-        return results
+        company_names = sample_pool(rng, company_pool, batch_size)
+        company_emails = sample_pool(rng, company_email_pool, batch_size)
+        contact_names = sample_pool(rng, name_pool, batch_size)
+        industries = rng.choice(['Retail', 'Manufacturing', 'Finance', 'IT'], size=batch_size)
+        reasons = rng.choice(COMPANY_REASONS, size=batch_size)
+        industry_risk_ratings = rng.choice(['Low', 'Medium', 'High'], size=batch_size)
+
+        ages = rng.integers(1, 21, size=batch_size, dtype=np.int8)
+        turnovers = rng.integers(5000000, 50000001, size=batch_size, dtype=np.int32)
+        registration_years = rng.integers(1900, year + 1, size=batch_size)
+        registration_serials = rng.integers(100000, 1000000, size=batch_size)
+        registration_suffixes = rng.integers(1, 100, size=batch_size)
+
+        # One array per column, so pandas does not have to infer types from a
+        # list of per-company dicts
+        return {
+            'customer_id': sequential_ids(f'COM{year % 100}', batch_size),
+            'customer_type': 'Company',
+            'full_name': company_names,
+            'birth_date': None,
+            'citizenship': 'ZA',
+            'residential_address': None,
+            'commercial_address': sample_addresses(rng, ctx, street_pool, batch_size),
+            'email': company_emails,
+            'phone_number': generate_phone_numbers(np.full(batch_size, 'South Africa'), rng),
+            'id_type': 'Registration Number',
+            'id_number': np.char.add(
+                np.char.add(registration_years.astype(str), '/'),
+                np.char.add(np.char.add(registration_serials.astype(str), '/'), registration_suffixes.astype(str))
+            ),
+            'expiry_date': None,
+            'visa_type': None,
+            'visa_expiry_date': None,
+            'is_pep': False,
+            'sanctioned_country': False,
+            'risk_score': np.round(0.15 + rng.random(batch_size, dtype=np.float32) * 0.2, 3),
+            'tax_id_number': random_digit_strings(rng, batch_size, 10),
+            'occupation': industries,
+            'employer_name': None,
+            'source_of_funds': 'Business Income',
+            'marital_status': None,
+            'nationality': 'South Africa',
+            'gender': None,
+            'preferred_contact_method': 'Email',
+            'next_of_kin': contact_names,
+            'date_of_entry': random_entry_dates(rng, year, batch_size).astype(object),
+            'annual_income': turnovers,
+            'age': ages,
+            'education_level': None,
+            'ethnicity': None,
+            'reason_for_opening_account': reasons,
+            'company_age': ages,
+            'number_of_employees': rng.integers(10, 101, size=batch_size, dtype=np.uint16),
+            'annual_turnover': turnovers,
+            'directors_count': rng.integers(1, 4, size=batch_size, dtype=np.uint8),
+            'shareholders_count': rng.integers(1, 6, size=batch_size, dtype=np.uint8),
+            'bee_level': rng.integers(1, 9, size=batch_size, dtype=np.uint8),
+            'vat_registered': rng.random(batch_size) < 0.8,
+            'industry_risk_rating': industry_risk_ratings
+        }
 
     print(f"Starting generation for year {year}...")
 
@@ -234,47 +424,66 @@ def generate_customer_data(year):
         print("No customers generated for this year.")
         df = pd.DataFrame()
     else:
-        all_customers = []
-        batch_size = 1000
+        batch_size = INDIVIDUAL_BATCH_SIZE
         individual_batches = (num_individuals + batch_size - 1) // batch_size
+        # Each batch gets its own child of the year's SeedSequence so results
+        # do not depend on which worker runs it
+        tasks = [
+            (ctx, min(batch_size, num_individuals - batch * batch_size), child_seed)
+            for batch, child_seed in enumerate(seed_seq.spawn(individual_batches))
+        ]
+        n_workers = n_workers or os.cpu_count()
 
         print(f"Generating {num_individuals} individuals in {individual_batches} batches...")
-        for batch in tqdm(range(individual_batches), desc="Individual batches"):
-            remaining = num_individuals - batch * batch_size
-            current_batch_size = min(batch_size, remaining)
-            batch_customers = generate_batch_individuals(current_batch_size)
-            all_customers.extend(batch_customers)
+        if n_workers > 1 and num_individuals >= PARALLEL_MIN_INDIVIDUALS:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                batch_columns = list(tqdm(executor.map(_generate_individuals_chunk, tasks), total=len(tasks), desc="Individual batches"))
+        else:
+            batch_columns = [_generate_individuals_chunk(task) for task in tasks]
+
+        customer_frames = []
+        if num_individuals > 0:
+            # Ids are numbered across the whole year rather than per batch
+            individual_columns = {
+                'customer_id': sequential_ids(f'IND{year % 100}', num_individuals),
+                **concat_batch_columns(batch_columns)
+            }
+            # Batches draw their emails independently, so collisions across
+            # batches are only resolved once they are joined
+            individual_columns['email'] = redraw_duplicate_emails(rng, individual_columns['full_name'], individual_columns['email'])
+            customer_frames.append(pd.DataFrame(individual_columns))
 
         if num_companies > 0:
             print(f"Generating {num_companies} companies...")
-            company_customers = generate_batch_companies(num_companies)
-            all_customers.extend(company_customers)
-
-        df = pd.DataFrame(all_customers)
-        if not df.empty and 'customer_type' in df.columns:
-            individual_mask = df['customer_type'] == 'Individual'
-            num_individuals_df = individual_mask.sum()
-            if num_individuals_df > 0:
-                next_of_kin_indices = np.random.choice(
-                    df[individual_mask].index,
-                    size=min(int(num_individuals_df * 0.1), num_individuals_df),
-                    replace=False
-                )
-                df.loc[next_of_kin_indices, 'next_of_kin'] = [fake.name() for _ in next_of_kin_indices]
-
-        df = df.sample(frac=1, random_state=seed_int).reset_index(drop=True)
+            customer_frames.append(pd.DataFrame(generate_batch_companies(num_companies)))
+
+        df = pd.concat(customer_frames, ignore_index=True)
+
+        # Shuffle so individuals and companies are interleaved
+        df = df.take(rng.permutation(len(df))).reset_index(drop=True)
+        df = compact_customer_dtypes(df)
 
     # Save to file
     github_repo_path = 'banking_data'
     os.makedirs(github_repo_path, exist_ok=True)
     output_file = f'{github_repo_path}/customers_{year}.parquet'
-    df.to_parquet(output_file, index=False)
+    df.to_parquet(
+        output_file, engine='pyarrow', compression='zstd', compression_level=3,
+        use_dictionary=True, row_group_size=PARQUET_ROW_GROUP_SIZE, index=False
+    )
 
     print(f"Generated {len(df)} customers (Individuals: {num_individuals}, Companies: {num_companies}) for year {year}")
     print(f"Saved to {output_file}")
 
     return df
 
+def generate_all_years(years, max_workers=None):
+    # Years are independent, so each one runs in its own process; every call
+    # seeds itself and creates its own Faker instance
+    years = list(years)
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return dict(zip(years, executor.map(partial(generate_customer_data, n_workers=1), years)))
+
 if __name__ == "__main__":
     # Example: Generate for a single year
     year = 2024
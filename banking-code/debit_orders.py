@@ -1,16 +1,29 @@
 ```python
 import pandas as pd
 import numpy as np
-from faker import Faker
-import random
-from datetime import datetime, timedelta
 import os
 import glob
-from tqdm import tqdm
+import pyarrow.parquet as pq
+import pyarrow.dataset as ds
+from transaction_formats import transaction_ids, format_times
 
 # Set the default start year here (change this to your desired year)
 START_YEAR = 2018
 
+# Loan columns the payments are scheduled and built from
+LOAN_COLUMNS = ["loan_id", "account_id", "customer_id", "loan_type", "approval_date", "terms_months", "monthly_installment"]
+
+# Low-cardinality output columns, stored as categoricals
+CATEGORY_COLUMNS = ["debit_credit", "status", "channel", "loan_type"]
+
+# Repetitive output columns dictionary-encoded in the parquet file;
+# transaction ids are unique and stay plain
+DICTIONARY_COLUMNS = CATEGORY_COLUMNS + ["account_id", "customer_id", "loan_id"]
+
+# Rows per parquet row group; payments are in date order, so each group
+# covers a narrow transaction_date range
+ROW_GROUP_SIZE = 256_000
+
 def generate_loan_payment_transactions(start_year=START_YEAR, end_year=2024):
     """
     Generate loan payment transactions from start_year to end_year.
@@ -20,64 +33,66 @@ def generate_loan_payment_transactions(start_year=START_YEAR, end_year=2024):
     end_year (int): Ending year for transaction generation (default: 2024)
     """
     
-    # Initialize Faker
-    fake = Faker()
-    
     # File paths
     github_repo_path = 'banking_data'
     
-    # Load all loan files for the year range
-    all_loans = []
+    # Find the loan files for the year range
+    loan_files = []
     for year in range(start_year, end_year + 1):
         loan_file = f'{github_repo_path}/loans_{year}.parquet'
-        try:
-            df = pd.read_parquet(loan_file)
-            all_loans.append(df)
-            print(f"Loaded loans for {year}: {len(df)} records")
-        except FileNotFoundError:
+        if os.path.exists(loan_file):
+            loan_files.append(loan_file)
+            print(f"Found loans for {year}: {pq.read_metadata(loan_file).num_rows} records")
+        else:
             print(f"Loan file for {year} not found: {loan_file}")
     
-    if not all_loans:
+    if not loan_files:
         print("No loan files found. Please generate loan data first.")
         return pd.DataFrame()
     
-    # Combine all loans
-    loans_df = pd.concat(all_loans, ignore_index=True)
-    print(f"Total loans loaded: {len(loans_df)}")
+    # Scan all years as one dataset, so no per-file frames are concatenated
+    loans_dataset = ds.dataset(loan_files, format="parquet")
+    print(f"Total loans loaded: {loans_dataset.count_rows()}")
     
     # Load loan default data (if available)
     try:
         default_file = f'{github_repo_path}/loan_defaults.parquet'
         defaults_df = pd.read_parquet(default_file)
         print(f"Loaded loan defaults: {len(defaults_df)} records")
-        default_map = dict(zip(defaults_df['loan_id'], zip(defaults_df['will_default'], defaults_df['default_date'])))
+        # Default date of each loan whose latest record will default
+        defaults_df = defaults_df.drop_duplicates(subset=['loan_id'], keep='last')
+        defaults_df = defaults_df[defaults_df['will_default'].astype(bool) & defaults_df['default_date'].notna()]
+        default_dates_by_loan = pd.Series(pd.to_datetime(defaults_df['default_date']).to_numpy(), index=defaults_df['loan_id'])
     except FileNotFoundError:
         print(f"Loan defaults file not found: {default_file}. Assuming no defaults.")
-        default_map = {}
+        default_dates_by_loan = pd.Series(dtype="datetime64[ns]")
     
     # Load accounts data to get transaction costs (if available)
     try:
         account_files = sorted(glob.glob(f'{github_repo_path}/accounts_*.parquet'))
         if account_files:
-            accounts_list = [pd.read_parquet(f) for f in account_files]
-            accounts_df = pd.concat(accounts_list, ignore_index=True).drop_duplicates(subset=['account_id'])
+            # Only the account id and cost columns are read
+            accounts_dataset = ds.dataset(account_files, format="parquet")
+            cost_columns = [column for column in ("account_id", "transaction_cost") if column in accounts_dataset.schema.names]
+            accounts_df = accounts_dataset.to_table(columns=cost_columns).to_pandas().drop_duplicates(subset=['account_id'])
             if "transaction_cost" in accounts_df.columns:
-                account_cost_map = dict(zip(accounts_df["account_id"], accounts_df["transaction_cost"]))
+                account_costs = pd.Series(accounts_df["transaction_cost"].to_numpy(), index=accounts_df["account_id"])
             else:
-                account_cost_map = {acc: 5.0 for acc in accounts_df["account_id"]}
+                account_costs = pd.Series(5.0, index=accounts_df["account_id"])
         else:
-            account_cost_map = {}
+            account_costs = pd.Series(dtype=float)
     except Exception as e:
         print(f"Could not load accounts data: {e}")
-        account_cost_map = {}
+        account_costs = pd.Series(dtype=float)
     
-    # Filter approved loans only
-    approved_loans = loans_df[loans_df["application_status"] == "Approved"].copy()
+    # Filter approved loans only, while scanning
+    approved_loans = loans_dataset.to_table(
+        columns=LOAN_COLUMNS, filter=ds.field("application_status") == "Approved"
+    ).to_pandas()
     print(f"Approved loans: {len(approved_loans)}")
     
     # Convert date columns to datetime
     approved_loans["approval_date"] = pd.to_datetime(approved_loans["approval_date"])
-    approved_loans["application_date"] = pd.to_datetime(approved_loans["application_date"])
     
     # Transaction channels
     channels = ["Online", "Mobile", "ATM", "Branch", "Automated"]
@@ -86,93 +101,78 @@ def generate_loan_payment_transactions(start_year=START_YEAR, end_year=2024):
     transaction_statuses = ["Completed", "Failed", "Cancelled"]
     status_weights = [0.92, 0.06, 0.02]  # Most payments complete successfully
     
-    transactions = []
-    txn_counter = 1
+    # Loans are scheduled on month numbers (year * 12 + month); payments fall
+    # on the first of each month in the range
+    first_month = start_year * 12 + 1
+    last_month = end_year * 12 + 12
+    approval_dates = approved_loans["approval_date"]
+    approval_month = approval_dates.dt.year.to_numpy() * 12 + approval_dates.dt.month.to_numpy()
     
-    # Generate date range for all years
-    start_date = datetime(start_year, 1, 1)
-    end_date = datetime(end_year, 12, 31)
-    date_range = pd.date_range(start_date, end_date, freq='MS')  # Monthly start dates
+    # Payments run for terms_months starting in the approval month
+    payment_start = np.maximum(approval_month, first_month)
+    payment_end = np.minimum(approval_month + approved_loans["terms_months"].to_numpy(), last_month + 1)
     
-    def loan_payment_occurs_on(loan, date):
-        """Check if a loan payment should occur on a specific date"""
-        approval_date = loan["approval_date"]
-        terms_months = loan["terms_months"]
-        loan_id = loan["loan_id"]
-        
-        # Calculate payment date (first of each month after approval)
-        months_since_approval = (date.year - approval_date.year) * 12 + date.month - approval_date.month
-        if months_since_approval < 0 or months_since_approval >= terms_months:
-            return False
-        
-        # Check if loan defaulted
-        if loan_id in default_map:
-            will_default, default_date = default_map[loan_id]
-            if will_default and pd.notnull(default_date):
-                default_date = pd.to_datetime(default_date)
-                if date >= default_date:
-                    return False
-        
-        # Payment occurs on the first of the month
-        return date.day == 1
+    # Defaulted loans stop before the first month start on or after the
+    # default date
+    default_dates = default_dates_by_loan.reindex(approved_loans["loan_id"])
+    default_month = default_dates.dt.year * 12 + default_dates.dt.month + (default_dates > default_dates.dt.to_period("M").dt.start_time)
+    payment_end = np.minimum(payment_end, default_month.fillna(last_month + 1).to_numpy(dtype=np.int64))
     
     print("Generating loan payment transactions...")
     
-    # Process each date in the range
-    for single_date in tqdm(date_range, desc="Processing dates"):
-        day_transactions = []
-        
-        # Check each approved loan
-        for _, loan in approved_loans.iterrows():
-            if loan_payment_occurs_on(loan, single_date):
-                
-                # Determine transaction status
-                status = np.random.choice(transaction_statuses, p=status_weights)
-                
-                # Generate transaction time (typically early morning)
-                if random.random() < 0.7:  # 70% process between 06:00-09:00
-                    txn_hour = random.randint(6, 8)
-                else:  # 30% process throughout business hours
-                    txn_hour = random.randint(9, 17)
-                txn_minute = random.randint(0, 59)
-                txn_second = random.randint(0, 59)
-                txn_time = f"{txn_hour:02d}:{txn_minute:02d}:{txn_second:02d}"
-                
-                # Determine if it's an immediate payment (rare)
-                immediate_payment = random.random() < 0.05  # 5% chance
-                
-                # Calculate transaction cost
-                trans_cost = account_cost_map.get(loan["account_id"], 5.0) if immediate_payment else 0.0
-                
-                # Create transaction record
-                transaction = {
-                    "transaction_id": f"TXN{txn_counter:08d}",
-                    "account_id": loan["account_id"],
-                    "transaction_date": single_date.strftime("%Y-%m-%d"),
-                    "transaction_time": txn_time,
-                    "amount": loan["monthly_installment"],
-                    "debit_credit": "Debit",  # Loan payments are debits
-                    "status": status,
-                    "description": f"Loan Payment - {loan['loan_id']}",
-                    "immediate_payment": immediate_payment,
-                    "receiving_account": None,  # Loan payments typically go to the bank
-                    "transaction_cost": trans_cost,
-                    "ewallet_number": None,  # Not applicable for loan payments
-                    "channel": np.random.choice(channels, p=[0.05, 0.10, 0.02, 0.03, 0.80]),  # Heavily weighted to Automated
-                    "loan_id": loan["loan_id"],
-                    "customer_id": loan["customer_id"],
-                    "loan_type": loan["loan_type"]
-                }
-                
-                day_transactions.append(transaction)
-                txn_counter += 1
-        
-        # Add all transactions for this day
-        transactions.extend(day_transactions)
+    # Expand each loan into one row per payment month, then order by month
+    # and loan as the payments are processed
+    payment_counts = np.clip(payment_end - payment_start, 0, None)
+    loan_positions = np.repeat(np.arange(len(approved_loans)), payment_counts)
+    payment_months = np.repeat(payment_start - np.cumsum(payment_counts) + payment_counts, payment_counts) + np.arange(len(loan_positions))
+    payment_order = np.lexsort((loan_positions, payment_months))
+    loan_positions = loan_positions[payment_order]
+    payment_months = payment_months[payment_order]
+    
+    scheduled_loans = approved_loans.iloc[loan_positions]
+    # Each payment month is formatted once and picked per payment
+    unique_months, month_positions = np.unique(payment_months, return_inverse=True)
+    payment_dates = pd.DatetimeIndex((unique_months - 1 - 1970 * 12).astype("datetime64[M]")).strftime("%Y-%m-%d").to_numpy()[month_positions]
+    num_transactions = len(scheduled_loans)
+    
+    # Every random field is drawn for all payments at once from one generator
+    rng = np.random.default_rng()
+    statuses = rng.choice(transaction_statuses, size=num_transactions, p=status_weights)
+    txn_channels = rng.choice(channels, size=num_transactions, p=[0.05, 0.10, 0.02, 0.03, 0.80])  # Heavily weighted to Automated
+    
+    # Transaction times (typically early morning): 70% between 06:00-09:00,
+    # the rest throughout business hours
+    txn_hours = np.where(
+        rng.random(num_transactions) < 0.7,
+        rng.integers(6, 9, size=num_transactions),
+        rng.integers(9, 18, size=num_transactions)
+    )
+    txn_times = format_times(txn_hours * 3600 + rng.integers(0, 3600, size=num_transactions))
+    
+    # Immediate payments are rare (5% chance) and the only ones with a cost
+    immediate_payments = rng.random(num_transactions) < 0.05
+    transaction_costs = np.where(immediate_payments, scheduled_loans["account_id"].map(account_costs).fillna(5.0).to_numpy(), 0.0)
     
     # Create DataFrame
     print("Creating transactions DataFrame...")
-    transactions_df = pd.DataFrame(transactions)
+    transactions_df = pd.DataFrame({
+        "transaction_id": transaction_ids(num_transactions),
+        "account_id": scheduled_loans["account_id"].to_numpy(),
+        "transaction_date": payment_dates,
+        "transaction_time": txn_times,
+        "amount": scheduled_loans["monthly_installment"].to_numpy(),
+        "debit_credit": "Debit",  # Loan payments are debits
+        "status": statuses,
+        "description": ("Loan Payment - " + scheduled_loans["loan_id"].astype(str)).to_numpy(),
+        "immediate_payment": immediate_payments,
+        "receiving_account": None,  # Loan payments typically go to the bank
+        "transaction_cost": transaction_costs,
+        "ewallet_number": None,  # Not applicable for loan payments
+        "channel": txn_channels,
+        "loan_id": scheduled_loans["loan_id"].to_numpy(),
+        "customer_id": scheduled_loans["customer_id"].to_numpy(),
+        "loan_type": scheduled_loans["loan_type"].to_numpy()
+    }).astype(dict.fromkeys(CATEGORY_COLUMNS, "category"))
     
     if len(transactions_df) == 0:
         print("No transactions generated. Please check your loan data.")
@@ -181,7 +181,10 @@ def generate_loan_payment_transactions(start_year=START_YEAR, end_year=2024):
     # Save to file
     output_file = f'{github_repo_path}/loan_payment_transactions_{start_year}_{end_year}.parquet'
     os.makedirs(github_repo_path, exist_ok=True)
-    transactions_df.to_parquet(output_file, index=False)
+    transactions_df.to_parquet(
+        output_file, index=False,
+        compression="zstd", compression_level=3, use_dictionary=DICTIONARY_COLUMNS, row_group_size=ROW_GROUP_SIZE
+    )
     
     # Summary statistics
     print(f"\nGenerated {len(transactions_df)} loan payment transactions")
@@ -240,7 +243,7 @@ if __name__ == "__main__":
      - `loans_<year>.parquet` files for 2018 to 2024 (or the specified range).
      - `loan_defaults.parquet` (optional, for default information).
      - `accounts_*.parquet` (optional, for transaction costs).
-   - Install dependencies: `pip install pandas numpy faker tqdm`.
+   - Install dependencies: `pip install pandas numpy pyarrow`.
    - Run from the terminal:
      ```bash
      python generate_loan_payment_transactions.py
@@ -270,6 +273,6 @@ if __name__ == "__main__":
 ### Notes
 - **Missing Files**: If `loans_<year>.parquet` or `loan_defaults.parquet` are missing, the script will notify you and may return an empty DataFrame.
 - **Data Schema**: Ensure the loan data matches the provided schema (e.g., contains `monthly_installment`, `terms_months`, `approval_date`).
-- **Performance**: Uses `tqdm` for progress tracking and processes only the 1st of each month (`freq='MS'`) to optimize speed compared to daily checks.
+- **Performance**: Expands each loan into its payment months with array arithmetic (no per-loan, per-month loop) and draws all random fields for the payments at once.
 
 If you need help creating sample input files or encounter issues running the script, let me know!
\ No newline at end of file
@@ -2,19 +2,106 @@ import pandas as pd
 import numpy as np
 import random
 import math
-from faker import Faker
 from datetime import date, timedelta, datetime
 import os
 from tqdm import tqdm
 import argparse
 import glob
-
-fake = Faker()
+from itertools import accumulate
+
+AGE_RANGES = ((18, 25), (26, 35), (36, 45), (46, 55), (56, 65), (66, 80))
+AGE_WEIGHTS = (0.25, 0.30, 0.20, 0.15, 0.07, 0.03)
+# random.choices re-accumulates plain weights on every call; these are built once
+AGE_CUM_WEIGHTS = tuple(accumulate(AGE_WEIGHTS))
+
+# Largest share of monthly income a loan repayment may take, per loan type
+MAX_DTI_RATIOS = {
+    "Home Loan": 0.28,
+    "Personal Loan": 0.15,
+    "Business Loan": 0.25,
+    "Vehicle Loan": 0.20,
+    "Education Loan": 0.10
+}
+
+# Affordability multiplier per occupation (1.0 for any other occupation)
+STABILITY_MULTIPLIERS = {
+    'Doctor': 1.2, 'Lawyer': 1.2, 'Engineer': 1.1, 'Teacher': 1.0,
+    'Unemployed': 0.0, 'Self-Employed': 0.8, 'Student': 0.3
+}
+
+# Loan purposes and their weights per loan type, with the festive-season
+# personal loan and planting/harvest business loan variants
+LOAN_PURPOSES = {
+    "Home Loan": ("Purchase", "Refinance", "Construction", "Home Improvement"),
+    "Personal Loan": ("Debt Consolidation", "Medical", "Wedding", "Travel", "Emergency"),
+    "Business Loan": ("Equipment", "Working Capital", "Expansion", "Inventory"),
+    "Vehicle Loan": ("New Car", "Used Car", "Motorcycle", "Commercial Vehicle"),
+    "Education Loan": ("Tuition", "Living Expenses", "Books", "Study Abroad")
+}
+LOAN_PURPOSE_WEIGHTS = {
+    "Home Loan": (0.4, 0.3, 0.15, 0.15),
+    "Personal Loan": (0.6, 0.15, 0.1, 0.1, 0.05),
+    "Business Loan": (0.3, 0.4, 0.2, 0.1),
+    "Vehicle Loan": (0.5, 0.3, 0.1, 0.1),
+    "Education Loan": (0.4, 0.3, 0.2, 0.1)
+}
+FESTIVE_PERSONAL_LOAN_PURPOSE_WEIGHTS = (0.5, 0.2, 0.15, 0.1, 0.05)
+SEASONAL_BUSINESS_LOAN_PURPOSE_WEIGHTS = (0.2, 0.5, 0.2, 0.1)
+LOAN_PURPOSE_CUM_WEIGHTS = {loan_type: tuple(accumulate(weights)) for loan_type, weights in LOAN_PURPOSE_WEIGHTS.items()}
+FESTIVE_PERSONAL_LOAN_PURPOSE_CUM_WEIGHTS = tuple(accumulate(FESTIVE_PERSONAL_LOAN_PURPOSE_WEIGHTS))
+SEASONAL_BUSINESS_LOAN_PURPOSE_CUM_WEIGHTS = tuple(accumulate(SEASONAL_BUSINESS_LOAN_PURPOSE_WEIGHTS))
+
+# Interest rate adjustment (percentage points) per loan type
+LOAN_TYPE_RATE_ADJUSTMENTS = {
+    "Home Loan": -0.5,
+    "Vehicle Loan": 0.0,
+    "Education Loan": 0.5,
+    "Personal Loan": 2.0,
+    "Business Loan": 1.0
+}
+
+# Approval probability multiplier per application channel
+CHANNEL_APPROVAL_MODIFIERS = {
+    'walk_in_branch': 1.1,
+    'mobile_app': 0.9,
+    'broker_channel': 1.2,
+    'call_center': 0.85
+}
+
+# Mean credit bureau enquiries per window for each customer pattern
+INQUIRY_PATTERNS = {
+    'stable_customer': {'hour': 0.01, 'day': 0.1, 'week': 0.5, 'month': 1, 'year': 3},
+    'rate_shopping': {'hour': 0.8, 'day': 4, 'week': 8, 'month': 12, 'year': 20},
+    'financial_distress': {'hour': 2, 'day': 8, 'week': 25, 'month': 60, 'year': 150},
+    'credit_repair': {'hour': 0.2, 'day': 1, 'week': 3, 'month': 8, 'year': 15}
+}
+
+# Chance each supporting document is available, by employment category and company size
+DOC_AVAILABILITY = {
+    'Formal Employee': {'bank_statement': 0.8, 'payslip': 0.9, 'employment_letter': 0.6},
+    'Self-Employed': {'bank_statement': 0.9, 'tax_returns': 0.4, 'financial_statements': 0.2, 'employment_letter': 0.3},
+    'Informal Worker': {'bank_statement': 0.3, 'proof_of_income': 0.1, 'employment_letter': 0.05}
+}
+COMPANY_DOC_AVAILABILITY = {
+    'audited_financials': {'Small': 0.3, 'Large': 0.95},
+    'tax_compliance_certificate': {'Small': 0.7, 'Large': 0.95}
+}
+
+PSYCHOLOGICAL_AMOUNTS = (50000, 75000, 100000, 150000, 200000, 250000, 500000, 1000000)
+
+# Loan amount multiplier per calendar month (January first) for seasonal industries
+def _monthly_multipliers(overrides):
+    return tuple(overrides.get(month, 1.0) for month in range(1, 13))
+
+NEUTRAL_MONTH_MULTIPLIERS = _monthly_multipliers({})
+COMPANY_SEASONAL_MULTIPLIERS = {
+    'Agriculture': _monthly_multipliers({3: 2.5, 4: 1.8, 9: 2.0, 10: 1.5}),
+    'Retail': _monthly_multipliers({10: 2.5, 11: 2.0, 1: 0.4}),
+    'Construction': _monthly_multipliers({9: 1.8, 10: 1.6, 5: 0.7})
+}
 
 def generate_realistic_age():
-    age_ranges = [(18, 25), (26, 35), (36, 45), (46, 55), (56, 65), (66, 80)]
-    weights = [0.25, 0.30, 0.20, 0.15, 0.07, 0.03]
-    age_range = random.choices(age_ranges, weights=weights)[0]
+    age_range = random.choices(AGE_RANGES, cum_weights=AGE_CUM_WEIGHTS)[0]
     return random.randint(*age_range)
 
 def calculate_age(birth_date, target_year):
@@ -50,20 +137,9 @@ def calculate_loan_eligibility(customer_data, loan_type, target_year):
     age = calculate_age(customer_data.get('birth_date', date(1990, 1, 1)), target_year) if customer_data.get('customer_type') == 'Individual' else 40
     employment_type = customer_data.get('occupation', 'Unknown')
     
-    max_dti_ratios = {
-        "Home Loan": 0.28,
-        "Personal Loan": 0.15,
-        "Business Loan": 0.25,
-        "Vehicle Loan": 0.20,
-        "Education Loan": 0.10
-    }
-    
-    max_monthly_payment = monthly_income * max_dti_ratios[loan_type]
+    max_monthly_payment = monthly_income * MAX_DTI_RATIOS[loan_type]
     
-    stability_multiplier = {
-        'Doctor': 1.2, 'Lawyer': 1.2, 'Engineer': 1.1, 'Teacher': 1.0,
-        'Unemployed': 0.0, 'Self-Employed': 0.8, 'Student': 0.3
-    }.get(employment_type, 1.0)
+    stability_multiplier = STABILITY_MULTIPLIERS.get(employment_type, 1.0)
     
     max_monthly_payment *= stability_multiplier
     
@@ -103,9 +179,8 @@ def calculate_realistic_loan_amount(customer_data, loan_type, term_months, inter
     base_amount = max(0, loan_caps[loan_type])
     
     # Psychological pricing effects
-    psychological_amounts = [50000, 75000, 100000, 150000, 200000, 250000, 500000, 1000000]
     if random.random() < 0.4:
-        base_amount = random.choice(psychological_amounts) * np.random.uniform(0.95, 1.05)
+        base_amount = random.choice(PSYCHOLOGICAL_AMOUNTS) * np.random.uniform(0.95, 1.05)
     
     # Social media influence for young individuals
     if customer_data['customer_type'] == 'Individual' and age < 35 and random.random() < 0.25:
@@ -121,15 +196,8 @@ def calculate_realistic_loan_amount(customer_data, loan_type, term_months, inter
     
     # Seasonal multipliers for companies
     if customer_data['customer_type'] == 'Company':
-        month = application_date.month
-        seasonal_multipliers = {
-            'Agriculture': {3: 2.5, 4: 1.8, 9: 2.0, 10: 1.5},
-            'Retail': {10: 2.5, 11: 2.0, 1: 0.4},
-            'Construction': {9: 1.8, 10: 1.6, 5: 0.7}
-        }
         industry = customer_data.get('occupation', 'Other')  # Using occupation as industry for companies
-        if industry in seasonal_multipliers and month in seasonal_multipliers[industry]:
-            base_amount *= seasonal_multipliers[industry][month]
+        base_amount *= COMPANY_SEASONAL_MULTIPLIERS.get(industry, NEUTRAL_MONTH_MULTIPLIERS)[application_date.month - 1]
     
     return max(0, min(base_amount, loan_caps[loan_type]))
 
@@ -183,28 +251,14 @@ def generate_credit_profile(customer_data, financial_distress, target_year):
     }
 
 def determine_loan_purpose_and_docs(loan_type, customer_data, application_date):
-    purposes = {
-        "Home Loan": ["Purchase", "Refinance", "Construction", "Home Improvement"],
-        "Personal Loan": ["Debt Consolidation", "Medical", "Wedding", "Travel", "Emergency"],
-        "Business Loan": ["Equipment", "Working Capital", "Expansion", "Inventory"],
-        "Vehicle Loan": ["New Car", "Used Car", "Motorcycle", "Commercial Vehicle"],
-        "Education Loan": ["Tuition", "Living Expenses", "Books", "Study Abroad"]
-    }
-    
     month = application_date.month
-    actual_purpose_weights = {
-        "Home Loan": [0.4, 0.3, 0.15, 0.15],
-        "Personal Loan": [0.6, 0.15, 0.1, 0.1, 0.05],
-        "Business Loan": [0.3, 0.4, 0.2, 0.1],
-        "Vehicle Loan": [0.5, 0.3, 0.1, 0.1],
-        "Education Loan": [0.4, 0.3, 0.2, 0.1]
-    }
-    if customer_data['customer_type'] == 'Individual' and month in [11, 12]:
-        actual_purpose_weights["Personal Loan"] = [0.5, 0.2, 0.15, 0.1, 0.05]
-    elif customer_data['customer_type'] == 'Company' and month in [3, 9]:
-        actual_purpose_weights["Business Loan"] = [0.2, 0.5, 0.2, 0.1]
+    purpose_cum_weights = LOAN_PURPOSE_CUM_WEIGHTS[loan_type]
+    if customer_data['customer_type'] == 'Individual' and month in (11, 12) and loan_type == "Personal Loan":
+        purpose_cum_weights = FESTIVE_PERSONAL_LOAN_PURPOSE_CUM_WEIGHTS
+    elif customer_data['customer_type'] == 'Company' and month in (3, 9) and loan_type == "Business Loan":
+        purpose_cum_weights = SEASONAL_BUSINESS_LOAN_PURPOSE_CUM_WEIGHTS
     
-    purpose = random.choices(purposes[loan_type], weights=actual_purpose_weights[loan_type])[0]
+    purpose = random.choices(LOAN_PURPOSES[loan_type], cum_weights=purpose_cum_weights)[0]
     
     required_docs = {
         'income_proof': True,
@@ -233,14 +287,6 @@ def calculate_risk_adjusted_rate(base_rate, credit_profile, loan_type, customer_
     else:
         risk_adjustment = 5.0
     
-    type_adjustments = {
-        "Home Loan": -0.5,
-        "Vehicle Loan": 0.0,
-        "Education Loan": 0.5,
-        "Personal Loan": 2.0,
-        "Business Loan": 1.0
-    }
-    
     employment_adjustment = 0.0
     if customer_data.get('customer_type') == 'Individual':
         if customer_data.get('occupation') == 'Self-Employed':
@@ -266,7 +312,7 @@ def calculate_risk_adjusted_rate(base_rate, credit_profile, loan_type, customer_
     else:
         economic_stress = 1.0
     
-    final_rate = (base_rate + risk_adjustment + type_adjustments[loan_type] + employment_adjustment +
+    final_rate = (base_rate + risk_adjustment + LOAN_TYPE_RATE_ADJUSTMENTS[loan_type] + employment_adjustment +
                   competitive_discount + loyalty_discount + new_customer_penalty + staff_discretion +
                   target_desperation_discount) * economic_stress
     return max(5.0, min(25.0, round(final_rate, 2)))
@@ -314,13 +360,7 @@ def simulate_approval_process(customer_data, loan_request, credit_profile, targe
     elif loan_officer_mood == 'quota_pressure' and application_date.day > 25:
         approval_prob *= 1.1
     
-    channel_modifiers = {
-        'walk_in_branch': 1.1,
-        'mobile_app': 0.9,
-        'broker_channel': 1.2,
-        'call_center': 0.85
-    }
-    approval_prob *= channel_modifiers.get(application_channel, 1.0)
+    approval_prob *= CHANNEL_APPROVAL_MODIFIERS.get(application_channel, 1.0)
     
     is_approved = random.random() < approval_prob
     status = 'Approved' if is_approved else 'Rejected'
@@ -354,16 +394,9 @@ def amortization_monthly_payment(principal, annual_rate_pct, term_months):
     return principal * numerator / denominator
 
 def credit_bureau_counts(distress, application_date, target_year):
-    inquiry_patterns = {
-        'stable_customer': {'hour': 0.01, 'day': 0.1, 'week': 0.5, 'month': 1, 'year': 3},
-        'rate_shopping': {'hour': 0.8, 'day': 4, 'week': 8, 'month': 12, 'year': 20},
-        'financial_distress': {'hour': 2, 'day': 8, 'week': 25, 'month': 60, 'year': 150},
-        'credit_repair': {'hour': 0.2, 'day': 1, 'week': 3, 'month': 8, 'year': 15}
-    }
-    
     # Increase financial distress inquiries in 2020
     pattern = 'financial_distress' if distress or (target_year == 2020 and random.random() < 0.3) else random.choice(['stable_customer', 'rate_shopping', 'credit_repair'])
-    counts = {k: max(0, int(np.random.poisson(v))) for k, v in inquiry_patterns[pattern].items()}
+    counts = {k: max(0, int(np.random.poisson(v))) for k, v in INQUIRY_PATTERNS[pattern].items()}
     
     hour = application_date.hour
     day = application_date.weekday()
@@ -377,18 +410,13 @@ def generate_document_flags(customer_data, loan_type, loan_amount, application_d
     month = application_date.month
     if customer_data['customer_type'] == 'Individual':
         employment_type = customer_data.get('occupation', 'Unknown')
-        doc_availability = {
-            'Formal Employee': {'bank_statement': 0.8, 'payslip': 0.9, 'employment_letter': 0.6},
-            'Self-Employed': {'bank_statement': 0.9, 'tax_returns': 0.4, 'financial_statements': 0.2, 'employment_letter': 0.3},
-            'Informal Worker': {'bank_statement': 0.3, 'proof_of_income': 0.1, 'employment_letter': 0.05}
-        }
         emp_category = 'Formal Employee' if employment_type in ['Doctor', 'Lawyer', 'Engineer', 'Teacher'] else \
                       'Self-Employed' if employment_type == 'Self-Employed' else 'Informal Worker'
         
-        flag_bank_statement = 1 if loan_amount > 100000 or employment_type == 'Self-Employed' else np.random.binomial(1, doc_availability[emp_category]['bank_statement'])
+        flag_bank_statement = 1 if loan_amount > 100000 or employment_type == 'Self-Employed' else np.random.binomial(1, DOC_AVAILABILITY[emp_category]['bank_statement'])
         flag_proof_of_address = np.random.binomial(1, 0.95)
-        flag_employment_verification = 0 if employment_type in ['Unemployed', 'Student'] else np.random.binomial(1, doc_availability[emp_category]['employment_letter'] * (0.7 if month in [12, 1] else 1.0))
-        flag_tax_returns = np.random.binomial(1, doc_availability[emp_category].get('tax_returns', 0.2))
+        flag_employment_verification = 0 if employment_type in ['Unemployed', 'Student'] else np.random.binomial(1, DOC_AVAILABILITY[emp_category]['employment_letter'] * (0.7 if month in [12, 1] else 1.0))
+        flag_tax_returns = np.random.binomial(1, DOC_AVAILABILITY[emp_category].get('tax_returns', 0.2))
         flag_car_ownership = np.random.binomial(1, 0.7 if customer_data.get('flag_own_car', 0) else 0.3)
         flag_property_valuation = 1 if loan_type == "Home Loan" else 0
         flag_vehicle_valuation = 1 if loan_type == "Vehicle Loan" else 0
@@ -397,20 +425,16 @@ def generate_document_flags(customer_data, loan_type, loan_amount, application_d
         flag_audited_financials = 0
     else:
         company_size = 'Large' if customer_data.get('number_of_employees', 0) > 50 else 'Small'
-        company_doc_chaos = {
-            'audited_financials': {'Small': 0.3, 'Large': 0.95},
-            'tax_compliance_certificate': {'Small': 0.7, 'Large': 0.95}
-        }
         flag_bank_statement = 1
         flag_proof_of_address = 1
         flag_employment_verification = 0
-        flag_tax_returns = np.random.binomial(1, company_doc_chaos['tax_compliance_certificate'][company_size])
+        flag_tax_returns = np.random.binomial(1, COMPANY_DOC_AVAILABILITY['tax_compliance_certificate'][company_size])
         flag_car_ownership = 0
         flag_property_valuation = 0
         flag_vehicle_valuation = 0
         flag_academic_records = 0
         flag_business_registration = 1
-        flag_audited_financials = np.random.binomial(1, company_doc_chaos['audited_financials'][company_size])
+        flag_audited_financials = np.random.binomial(1, COMPANY_DOC_AVAILABILITY['audited_financials'][company_size])
     
     return {
         'flag_bank_statement': flag_bank_statement,
@@ -468,7 +492,6 @@ def generate_loans(target_year):
     SEED = target_year
     random.seed(SEED)
     np.random.seed(SEED)
-    Faker.seed(SEED)
 
     base_year = 2018
     github_repo_path = 'banking_data'
@@ -551,7 +574,11 @@ def generate_loans(target_year):
     car_models = ["Corolla", "Focus", "Civic", "X5", "C-Class", "Golf", "A4", "Elantra", "Altima"]
     financial_distress_rate = 0.1 if target_year == 2020 else 0.05  # Increased distress in 2020
     system_origins = ['legacy_mainframe', 'new_digital', 'branch_manual', 'mobile_app', 'broker_channel']
-    system_weights = [0.2, 0.3, 0.2, 0.2, 0.1]
+    system_cum_weights = list(accumulate([0.2, 0.3, 0.2, 0.2, 0.1]))
+    # Applications fall uniformly between 1 Jan two years back and 1 Nov
+    application_start = datetime(target_year - 2, 1, 1)
+    application_window_seconds = (datetime(target_year, 11, 1) - application_start).total_seconds()
+    latest_vehicle_year = date.today().year
 
     loans = []
     loan_id_counter = 1
@@ -598,8 +625,8 @@ def generate_loans(target_year):
             customer_id = f"SUB-{customer_id}-{random.randint(1, 8)}"
 
         for _ in range(num_loans):
-            application_channel = random.choices(system_origins, weights=system_weights)[0]
-            application_date = fake.date_time_between(start_date=date(target_year-2, 1, 1), end_date=date(target_year, 11, 1))
+            application_channel = random.choices(system_origins, cum_weights=system_cum_weights)[0]
+            application_date = application_start + timedelta(seconds=random.uniform(0, application_window_seconds))
             month = application_date.month
             
             # Loan type selection with seasonal and economic effects
@@ -672,7 +699,7 @@ def generate_loans(target_year):
             if loan_type == "Home Loan":
                 collateral_description = customer_data.get('residential_address', 'Unknown Address')
             elif loan_type == "Vehicle Loan":
-                collateral_description = f"{fake.year()} {random.choice(car_brands)} {random.choice(car_models)}"
+                collateral_description = f"{random.randint(1970, latest_vehicle_year)} {random.choice(car_brands)} {random.choice(car_models)}"
             elif loan_type == "Business Loan":
                 collateral_description = random.choice(["Equipment", "Inventory", "Accounts Receivable", "None"])
             else:
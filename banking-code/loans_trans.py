@@ -1,6 +1,5 @@
 import pandas as pd
 import numpy as np
-from faker import Faker
 import random
 from datetime import datetime, timedelta
 import os
@@ -20,9 +19,6 @@ def generate_loan_payment_transactions(start_year=START_YEAR, end_year=2024):
     end_year (int): Ending year for transaction generation (default: 2024)
     """
     
-    # Initialize Faker
-    fake = Faker()
-    
     # File paths
     github_repo_path = 'banking_data'
     
@@ -462,95 +458,86 @@ def introduce_data_errors(df):
     df_with_errors = df.copy()
     n_rows = len(df_with_errors)
     
-    # Convert to object dtype for columns we'll be modifying to handle mixed types
-    df_with_errors = df_with_errors.astype({
-        'amount': 'object',
-        'transaction_cost': 'object',
-        'transaction_time': 'object',
-        'transaction_date': 'object',
-        'channel': 'object',
-        'status': 'object'
-    })
+    # Corrupt object copies of the affected columns by position and write each
+    # column back once at the end, instead of one .loc setitem per value
+    error_columns = [
+        'transaction_id', 'amount', 'transaction_cost', 'transaction_date', 'transaction_time',
+        'channel', 'status', 'description', 'loan_id', 'immediate_payment'
+    ]
+    columns = {col: df_with_errors[col].to_numpy(dtype=object, copy=True) for col in error_columns if col in df_with_errors.columns}
+    
+    def pick_rows(fraction):
+        return np.random.choice(n_rows, int(n_rows * fraction), replace=False)
+    
+    def pick_values(values, size):
+        return np.array(values, dtype=object)[np.random.randint(0, len(values), size=size)]
     
     # 1. Missing values (2-5% across different columns)
     missing_cols = ['transaction_time', 'description', 'channel']
     for col in missing_cols:
-        if col in df_with_errors.columns:
-            missing_indices = np.random.choice(n_rows, int(n_rows * 0.02), replace=False)
-            df_with_errors.loc[missing_indices, col] = None
+        if col in columns:
+            columns[col][pick_rows(0.02)] = None
     
     # 2. Duplicate transaction IDs (1% duplicates)
-    duplicate_indices = np.random.choice(n_rows, int(n_rows * 0.01), replace=False)
-    for idx in duplicate_indices:
-        if idx > 0:
-            df_with_errors.loc[idx, 'transaction_id'] = df_with_errors.loc[idx-1, 'transaction_id']
+    duplicate_indices = pick_rows(0.01)
+    duplicate_indices = duplicate_indices[duplicate_indices > 0]
+    columns['transaction_id'][duplicate_indices] = columns['transaction_id'][duplicate_indices - 1]
     
     # 3. Invalid amounts (negative or zero - 0.5%)
-    invalid_amount_indices = np.random.choice(n_rows, int(n_rows * 0.005), replace=False)
-    for idx in invalid_amount_indices:
-        original_amount = df_with_errors.loc[idx, 'amount']
-        df_with_errors.loc[idx, 'amount'] = random.choice([0, -abs(float(original_amount))])
+    invalid_amount_indices = pick_rows(0.005)
+    invalid_amounts = (-np.abs(columns['amount'][invalid_amount_indices].astype(float))).astype(object)
+    invalid_amounts[np.random.random(len(invalid_amount_indices)) < 0.5] = 0
+    columns['amount'][invalid_amount_indices] = invalid_amounts
     
     # 4. Invalid dates (future dates or malformed - 0.3%)
-    invalid_date_indices = np.random.choice(n_rows, int(n_rows * 0.003), replace=False)
-    for idx in invalid_date_indices[:len(invalid_date_indices)//2]:
-        df_with_errors.loc[idx, 'transaction_date'] = '2030-12-31'  # Future date
-    for idx in invalid_date_indices[len(invalid_date_indices)//2:]:
-        df_with_errors.loc[idx, 'transaction_date'] = '2024-13-45'  # Invalid date
+    invalid_date_indices = pick_rows(0.003)
+    columns['transaction_date'][invalid_date_indices[:len(invalid_date_indices)//2]] = '2030-12-31'  # Future date
+    columns['transaction_date'][invalid_date_indices[len(invalid_date_indices)//2:]] = '2024-13-45'  # Invalid date
     
     # 5. Invalid time formats (1%)
-    invalid_time_indices = np.random.choice(n_rows, int(n_rows * 0.01), replace=False)
+    invalid_time_indices = pick_rows(0.01)
     invalid_times = ['25:30:00', '12:65:30', '12:30:70', 'Invalid Time']
-    for idx in invalid_time_indices:
-        df_with_errors.loc[idx, 'transaction_time'] = random.choice(invalid_times)
+    columns['transaction_time'][invalid_time_indices] = pick_values(invalid_times, len(invalid_time_indices))
     
     # 6. Inconsistent channel values (0.8%)
-    invalid_channel_indices = np.random.choice(n_rows, int(n_rows * 0.008), replace=False)
+    invalid_channel_indices = pick_rows(0.008)
     invalid_channels = ['ONLINE', 'mobile', 'Branch Office', 'atm', '']
-    for idx in invalid_channel_indices:
-        df_with_errors.loc[idx, 'channel'] = random.choice(invalid_channels)
+    columns['channel'][invalid_channel_indices] = pick_values(invalid_channels, len(invalid_channel_indices))
     
     # 7. Inconsistent status values (0.5%)
-    invalid_status_indices = np.random.choice(n_rows, int(n_rows * 0.005), replace=False)
+    invalid_status_indices = pick_rows(0.005)
     invalid_statuses = ['COMPLETED', 'failed', 'Success', 'Pending', '']
-    for idx in invalid_status_indices:
-        df_with_errors.loc[idx, 'status'] = random.choice(invalid_statuses)
+    columns['status'][invalid_status_indices] = pick_values(invalid_statuses, len(invalid_status_indices))
     
     # 8. Mixed data types in numeric columns (create string representations)
-    mixed_type_indices = np.random.choice(n_rows, int(n_rows * 0.003), replace=False)
-    for idx in mixed_type_indices:
-        original_amount = df_with_errors.loc[idx, 'amount']
-        df_with_errors.loc[idx, 'amount'] = f"R{original_amount}"
+    mixed_type_indices = pick_rows(0.003)
+    columns['amount'][mixed_type_indices] = [f"R{amount}" for amount in columns['amount'][mixed_type_indices]]
     
     # 8b. Mixed data types in transaction_cost column
-    mixed_cost_indices = np.random.choice(n_rows, int(n_rows * 0.002), replace=False)
-    for idx in mixed_cost_indices:
-        original_cost = df_with_errors.loc[idx, 'transaction_cost']
-        df_with_errors.loc[idx, 'transaction_cost'] = f"${original_cost}"
+    mixed_cost_indices = pick_rows(0.002)
+    columns['transaction_cost'][mixed_cost_indices] = [f"${cost}" for cost in columns['transaction_cost'][mixed_cost_indices]]
     
     # 9. Whitespace issues (2%)
-    whitespace_indices = np.random.choice(n_rows, int(n_rows * 0.02), replace=False)
-    for idx in whitespace_indices:
-        if pd.notna(df_with_errors.loc[idx, 'description']):
-            df_with_errors.loc[idx, 'description'] = f"  {df_with_errors.loc[idx, 'description']}  "
+    whitespace_indices = pick_rows(0.02)
+    whitespace_indices = whitespace_indices[pd.notna(columns['description'][whitespace_indices])]
+    columns['description'][whitespace_indices] = [f"  {description}  " for description in columns['description'][whitespace_indices]]
     
     # 10. Invalid loan_id references (0.2% - reference non-existent loans)
-    invalid_loan_indices = np.random.choice(n_rows, int(n_rows * 0.002), replace=False)
-    for idx in invalid_loan_indices:
-        df_with_errors.loc[idx, 'loan_id'] = f"INVALID_LOAN_{random.randint(1000, 9999)}"
+    invalid_loan_indices = pick_rows(0.002)
+    columns['loan_id'][invalid_loan_indices] = [f"INVALID_LOAN_{number}" for number in np.random.randint(1000, 10000, size=len(invalid_loan_indices))]
     
     # 11. Inconsistent boolean values (for immediate_payment column)
-    if 'immediate_payment' in df_with_errors.columns:
-        bool_indices = np.random.choice(n_rows, int(n_rows * 0.01), replace=False)
+    if 'immediate_payment' in columns:
+        bool_indices = pick_rows(0.01)
         bool_values = ['TRUE', 'FALSE', 'Yes', 'No', '1', '0', 'true', 'false']
-        for idx in bool_indices:
-            df_with_errors.loc[idx, 'immediate_payment'] = random.choice(bool_values)
+        columns['immediate_payment'][bool_indices] = pick_values(bool_values, len(bool_indices))
     
     # 12. Extra leading/trailing characters in IDs
-    id_corruption_indices = np.random.choice(n_rows, int(n_rows * 0.005), replace=False)
-    for idx in id_corruption_indices:
-        original_id = str(df_with_errors.loc[idx, 'transaction_id'])
-        df_with_errors.loc[idx, 'transaction_id'] = f" {original_id} "
+    id_corruption_indices = pick_rows(0.005)
+    columns['transaction_id'][id_corruption_indices] = [f" {original_id} " for original_id in columns['transaction_id'][id_corruption_indices]]
+    
+    for col, values in columns.items():
+        df_with_errors[col] = values
     
     print(f"Introduced data quality issues in {len(df_with_errors)} transactions")
     return df_with_errors
@@ -1,5 +1,5 @@
 import numpy as np
-import random
+from functools import lru_cache
 
 def get_name_data():
     # Pre-compute name groups with expanded lists
@@ -97,19 +97,33 @@ def get_name_data():
 
     return name_groups, zw_names, ethnicity_probs, ethnicity_keys
 
-def generate_name(is_sa_prob=0.85):
+@lru_cache(maxsize=1)
+def get_name_pools():
+    # Full names packed into one padded 2D array, one row per SA ethnicity
+    # plus a final row for the Zimbabwe pool, with each row's real length.
+    # Built once per process
     name_groups, zw_names, ethnicity_probs, ethnicity_keys = get_name_data()
-    is_sa = random.random() < is_sa_prob
-    if is_sa:
-        ethnicity_idx = np.random.choice(len(ethnicity_keys), p=ethnicity_probs)
-        ethnicity = ethnicity_keys[ethnicity_idx]
-        first, last = random.choice(name_groups[ethnicity])
-        nationality = 'South Africa'
-        citizenship = 'ZA'
-    else:
-        first, last = random.choice(zw_names)
-        ethnicity = 'Foreign National'
-        nationality = 'Zimbabwe'
-        citizenship = 'ZW'
-    full_name = f"{first} {last}"
-    return full_name, nationality, citizenship, ethnicity
\ No newline at end of file
+    groups = [name_groups[ethnicity] for ethnicity in ethnicity_keys] + [zw_names]
+    pool_lens = np.array([len(group) for group in groups])
+    pool_arr = np.full((len(groups), pool_lens.max()), '', dtype=object)
+    for row, group in enumerate(groups):
+        pool_arr[row, :len(group)] = [f"{first} {last}" for first, last in group]
+    group_labels = np.array(ethnicity_keys + ['Foreign National'], dtype=object)
+    return pool_arr, pool_lens, group_labels, ethnicity_probs
+
+def generate_names(n, rng, is_sa_prob=0.85):
+    # Full name, nationality, citizenship and ethnicity for a batch of n
+    # people, drawn from the caller's np.random.Generator: South Africans
+    # (share is_sa_prob, by ethnicity weight), the rest Zimbabwean. Every
+    # name is one gather from the padded pool array
+    pool_arr, pool_lens, group_labels, ethnicity_probs = get_name_pools()
+    is_sa = rng.random(n) < is_sa_prob
+    ethnicity_idx = rng.choice(len(ethnicity_probs), size=n, p=ethnicity_probs)
+    group_idx = np.where(is_sa, ethnicity_idx, len(group_labels) - 1)
+    name_idx = (rng.random(n) * pool_lens[group_idx]).astype(np.int64)
+
+    full_names = pool_arr[group_idx, name_idx]
+    ethnicities = group_labels[group_idx]
+    nationalities = np.where(is_sa, 'South Africa', 'Zimbabwe').astype(object)
+    citizenships = np.where(is_sa, 'ZA', 'ZW').astype(object)
+    return full_names, nationalities, citizenships, ethnicities
@@ -1,28 +1,17 @@
 import pandas as pd
 import numpy as np
-from faker import Faker
 import random
-from datetime import date, timedelta
+from datetime import timedelta
 import os
 from tqdm import tqdm
 import glob
 
-fake = Faker()
-
 def generate_realistic_age():
     age_ranges = [(18, 25), (26, 35), (36, 45), (46, 55), (56, 65), (66, 80)]
     weights = [0.25, 0.30, 0.20, 0.15, 0.07, 0.03]
     age_range = random.choices(age_ranges, weights=weights)[0]
     return random.randint(*age_range)
 
-def calculate_age(birth_date, target_year):
-    try:
-        if pd.isna(birth_date) or not isinstance(birth_date, date):
-            return generate_realistic_age()
-        return target_year - birth_date.year
-    except (ValueError, TypeError):
-        return generate_realistic_age()
-
 def get_income_level(customer_data, target_year):
     income = customer_data.get('annual_income', 300000)
     if pd.isna(income) or income <= 0:
@@ -60,50 +49,56 @@ else:
 
 default_prob_base = 0.15
 
-default_records = []
-
-for _, loan in loans_df.iterrows():
-    # Adjust default probability based on risk_score from customer
-    customer_risk = customers_df[customers_df['customer_id'] == loan['customer_id']]['risk_score'].iloc[0] if not customers_df[customers_df['customer_id'] == loan['customer_id']].empty else 0.5
+if loans_df.empty:
+    loan_defaults_df = pd.DataFrame(columns=["loan_id", "will_default", "default_date"])
+else:
+    rng = np.random.default_rng()
+    application_dates = pd.to_datetime(loans_df["application_date"])
+    
+    # Adjust default probability based on risk_score from customer; loans
+    # without a known customer count as medium risk
+    risk_by_customer = customers_df.set_index("customer_id")["risk_score"]
+    customer_risk = loans_df["customer_id"].map(risk_by_customer).fillna(0.5).to_numpy()
     default_prob = default_prob_base * (1 + customer_risk * 2)  # Higher risk increases default prob
     
     # Increase default prob in 2020
-    if pd.to_datetime(loan["application_date"]).year == 2020:
-        default_prob *= 1.5
+    default_prob = np.where(application_dates.dt.year.to_numpy() == 2020, default_prob * 1.5, default_prob)
     
-    will_default = random.random() < default_prob
+    will_default = rng.random(len(loans_df)) < default_prob
     
-    if will_default:
-        # Pick a default date between application_date and end of term
-        start_date = pd.to_datetime(loan["application_date"])
-        term_months = loan.get("terms_months", 36)
-        end_date = start_date + pd.DateOffset(months=term_months)
-        delta_days = (end_date - start_date).days
-        
-        if delta_days > 0:
-            default_day_offset = random.randint(30, min(delta_days, 365 * 2))  # Default within 2 years
-            default_date = start_date + pd.Timedelta(days=default_day_offset)
-        else:
-            default_date = pd.NaT
-    else:
-        default_date = pd.NaT
+    # Length of each loan term in days: the term end keeps the application
+    # day of month, clipped to the last day of the end month
+    start_days = application_dates.to_numpy().astype("datetime64[D]")
+    end_months = start_days.astype("datetime64[M]") + loans_df["terms_months"].to_numpy()
+    days_in_end_month = ((end_months + 1).astype("datetime64[D]") - end_months.astype("datetime64[D]")).astype(int)
+    end_days = end_months.astype("datetime64[D]") + np.minimum(application_dates.dt.day.to_numpy(), days_in_end_month) - 1
+    delta_days = (end_days - start_days).astype(int)
+    
+    # Pick a default date between 30 days after application and the end of
+    # term, within 2 years
+    has_default_date = will_default & (delta_days > 0)
+    default_day_offset = np.zeros(len(loans_df), dtype=int)
+    default_day_offset[has_default_date] = rng.integers(30, np.minimum(delta_days[has_default_date], 365 * 2), endpoint=True)
+    default_dates = (application_dates + pd.to_timedelta(default_day_offset, unit="D")).where(has_default_date)
     
-    default_records.append({
-        "loan_id": loan["loan_id"],
+    loan_defaults_df = pd.DataFrame({
+        "loan_id": loans_df["loan_id"].to_numpy(),
         "will_default": will_default,
-        "default_date": default_date
+        "default_date": default_dates.to_numpy()
     })
 
-loan_defaults_df = pd.DataFrame(default_records)
-
 # --------- 2. Customer Employment Status Over Time ---------
 
 # Simulate monthly employment status from Jan 2018 to Dec 2024 (84 months)
 periods = pd.date_range("2018-01-01", "2024-12-01", freq='MS')  # Month start frequency
 
+# Birth years from one datetime conversion of the column; customers without
+# a usable birth date get a fresh realistic age each period
+birth_years = pd.to_datetime(customers_df["birth_date"], errors="coerce").dt.year.to_numpy()
+
 employment_records = []
 
-for _, cust in customers_df.iterrows():
+for (_, cust), birth_year in zip(customers_df.iterrows(), birth_years):
     cust_id = cust["customer_id"]
     # Initial employment status from occupation
     occupation = cust.get("occupation", "").lower()
@@ -121,7 +116,7 @@ for _, cust in customers_df.iterrows():
             rehire_prob *= 0.5  # Halve rehire probability
         
         # Adjust based on age and income
-        age = calculate_age(cust.get('birth_date', date(1990, 1, 1)), year)
+        age = generate_realistic_age() if np.isnan(birth_year) else year - birth_year
         income_level = get_income_level(cust, year)
         if age < 25 or age > 60:
             job_loss_prob *= 1.5
@@ -0,0 +1,10 @@
+import numpy as np
+
+def transaction_ids(count, first=1):
+    # count 'TXN' ids numbered from first, zero-padded to 8 digits
+    return np.char.add("TXN", np.char.zfill(np.arange(first, first + count).astype(str), 8))
+
+def format_times(seconds):
+    # HH:MM:SS strings for an array of seconds since midnight
+    hours, minutes, secs = (np.char.zfill(part.astype(str), 2) for part in (seconds // 3600, seconds // 60 % 60, seconds % 60))
+    return np.char.add(np.char.add(np.char.add(np.char.add(hours, ":"), minutes), ":"), secs)
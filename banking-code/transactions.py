@@ -426,6 +426,9 @@ def create_initial_deposits(eligible_accounts, customers_df, balance_tracker, da
     """Create initial deposit transactions and update balance tracker"""
     n_accounts = len(eligible_accounts)
     deposit_amounts = np.maximum(100, np.random.uniform(200, 8000, n_accounts)).round(2)
+    deposit_seconds = np.random.randint(0, 24 * 3600, n_accounts)
+    deposit_times = [f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in deposit_seconds]
+    deposit_channels = np.random.choice(["branch", "online banking"], n_accounts)
     
     transactions = []
     
@@ -442,7 +445,7 @@ def create_initial_deposits(eligible_accounts, customers_df, balance_tracker, da
             "transaction_id": f"TXN{year}{txn_counter + i:06d}",
             "account_id": account['account_id'],
             "transaction_date": date,
-            "transaction_time": fake.time(),
+            "transaction_time": deposit_times[i],
             "amount": amount,
             "debit_credit": "credit",
             "category": "initial deposit",
@@ -453,7 +456,7 @@ def create_initial_deposits(eligible_accounts, customers_df, balance_tracker, da
             "receiving_bank": "",
             "transaction_cost": 0.0,
             "ewallet_number": None,
-            "channel": np.random.choice(["branch", "online banking"]),
+            "channel": deposit_channels[i],
             "merchant_name": ""
         })
     
@@ -477,9 +480,19 @@ def generate_category_transactions(category, eligible_accounts, customers_df, ba
     transactions = []
     successful_transactions = 0
     
-    for _ in range(final_count):
-        customer = acc_cust.sample(n=1).iloc[0]
-        distress_level = customer.get('distress_level', 0.0)
+    # Customer fields as arrays, indexed by position instead of building a
+    # row Series per attempt
+    account_ids = acc_cust['account_id'].to_numpy()
+    distress_levels = acc_cust.get('distress_level', pd.Series(0.0, index=acc_cust.index)).to_numpy()
+    ages = acc_cust.get('age', pd.Series(30, index=acc_cust.index)).to_numpy()
+    incomes = acc_cust.get('income', pd.Series(25000, index=acc_cust.index)).to_numpy()
+    
+    # One customer per attempt, drawn with replacement in a single call
+    customer_positions = np.random.randint(0, len(acc_cust), final_count)
+    
+    for position in customer_positions:
+        account_id = account_ids[position]
+        distress_level = distress_levels[position]
         
         if distress_level > 0.5 and category in ['alcohol', 'entertainment', 'clothing', 'restaurants'] and random.random() < 0.5:
             continue  # Skip some discretionary for distressed
@@ -491,23 +504,23 @@ def generate_category_transactions(category, eligible_accounts, customers_df, ba
             continue
         
         amount = calculate_transaction_amount(
-            merchant_info, customer.get('age', 30),
-            max(0, customer.get('income', 25000)), category, distress_level
+            merchant_info, ages[position],
+            max(0, incomes[position]), category, distress_level
         )
         
-        if not balance_tracker.can_transact(customer['account_id'], amount):
-            current_balance = balance_tracker.get_balance(customer['account_id'])
-            overdraft_limit = balance_tracker.account_balances[customer['account_id']]['overdraft_limit']
+        if not balance_tracker.can_transact(account_id, amount):
+            current_balance = balance_tracker.get_balance(account_id)
+            overdraft_limit = balance_tracker.account_balances[account_id]['overdraft_limit']
             max_amount = current_balance - overdraft_limit - 20
             
             if max_amount < 10:
                 continue
             amount = min(amount, max_amount)
         
-        if balance_tracker.process_transaction(customer['account_id'], amount, 'debit'):
+        if balance_tracker.process_transaction(account_id, amount, 'debit'):
             transactions.append({
                 "transaction_id": f"TXN{year}{txn_counter + successful_transactions:06d}",
-                "account_id": customer['account_id'],
+                "account_id": account_id,
                 "transaction_date": single_date.strftime("%Y-%m-%d"),
                 "transaction_time": generate_realistic_time(category, single_date),
                 "amount": amount,